@@ -0,0 +1,77 @@
+"""Cost of move generation and search on every field size
+
+For every size the start position and positions after a few random turns are
+counted with perft, searched to a fixed depth and searched for a fixed time.
+
+Run from the repository root:
+    python -m benchmarks.board_sizes --perft-depth 4 --depth 6 --time 1
+"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+
+from checkers.rules import Position
+from checkers.perft import perft
+from checkers.search import Search
+from checkers.enums import GameResult
+from checkers.constants import BOARD_SIZES
+
+
+def benchmark_positions(size: int, count: int, seed: int = 1) -> list[Position]:
+    """Getting the start position and positions after a few random turns"""
+    random = Random(seed)
+    positions = [Position(size, size)]
+
+    while (len(positions) < count):
+        position = Position(size, size)
+        for _ in range(random.randrange(4, 16)):
+            if (position.result != GameResult.IN_PROGRESS): break
+            position.make_turn(random.choice(position.legal_turns()))
+
+        if (position.result == GameResult.IN_PROGRESS):
+            positions.append(position)
+
+    return positions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BOARD_SIZES))
+    parser.add_argument('--positions', type=int, default=4)
+    parser.add_argument('--perft-depth', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=6, help='depth of the fixed depth search')
+    parser.add_argument('--time', type=float, default=1.0, help='seconds of the fixed time search')
+    args = parser.parse_args()
+
+    print(f'{"size":>6} {"cells":>6} {"perft nodes/s":>14} {"search nodes/s":>15} '
+          f'{"depth " + str(args.depth):>10} {"depth in " + str(args.time) + " s":>14}')
+
+    for size in args.sizes:
+        positions = benchmark_positions(size, args.positions)
+
+        perft_nodes = 0
+        perft_time = 0.0
+        for position in positions:
+            started = perf_counter()
+            perft_nodes += perft(position, args.perft_depth)
+            perft_time += perf_counter() - started
+
+        search_nodes = 0
+        search_time = 0.0
+        for position in positions:
+            # A new transposition table for every position, allocated before timing
+            search = Search(args.depth, seed=1)
+            started = perf_counter()
+            search_nodes += search.search(position.field, position.side).nodes
+            search_time += perf_counter() - started
+
+        depths = [Search(args.depth, seed=1).search(position.field, position.side, 100,
+                                                     time_limit=args.time).depth for position in positions]
+
+        print(f'{f"{size}x{size}":>6} {size * size // 2:>6} {perft_nodes / perft_time:>14.0f} '
+              f'{search_nodes / search_time:>15.0f} {search_time / len(positions):>9.3f}s '
+              f'{sum(depths) / len(depths):>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Speedup of the root-parallel search over the single-process search
+
+Run from the repository root:
+    python -m benchmarks.parallel_search --workers 4 --depth 8
+"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+import os
+
+from checkers.bitboard import BitboardField
+from checkers.parallel import ParallelSearch
+from checkers.search import Search
+from checkers.tablebase import Tablebase
+from checkers.enums import SideType
+from checkers.constants import X_SIZE, Y_SIZE
+
+
+def benchmark_positions(count: int, seed: int = 1) -> list[tuple[BitboardField, SideType]]:
+    """Getting the start position and positions after a few random opening moves"""
+    random = Random(seed)
+    positions = [(BitboardField(X_SIZE, Y_SIZE), SideType.WHITE)]
+
+    while (len(positions) < count):
+        field = BitboardField(X_SIZE, Y_SIZE)
+        side = SideType.WHITE
+        for _ in range(random.randrange(4, 16)):
+            moves_list = field.moves(side)
+            if not (moves_list): break
+            move = random.choice(moves_list)
+            # Finishing a multi-capture with the same checker
+            while (field.make_move(move).has_captured and field.required_moves(side, move.to_x, move.to_y)):
+                move = random.choice(field.required_moves(side, move.to_x, move.to_y))
+            side = side.opposite()
+
+        if (field.moves(side)):
+            positions.append((field, side))
+
+    return positions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--depth', type=int, default=7)
+    parser.add_argument('--positions', type=int, default=8)
+    args = parser.parse_args()
+
+    positions = benchmark_positions(args.positions)
+
+    # Allocated before timing and kept over the positions, like the searches of the workers
+    search = Search(args.depth, tablebase=Tablebase.load())
+    single_time = 0.0
+    for field, side in positions:
+        started = perf_counter()
+        search.search(field, side)
+        single_time += perf_counter() - started
+
+    parallel_search = ParallelSearch(args.workers, args.depth)
+    # Starting the worker processes before timing
+    parallel_search.search(positions[0][0], positions[0][1], 1)
+
+    parallel_time = 0.0
+    for field, side in positions:
+        started = perf_counter()
+        parallel_search.search(field, side)
+        parallel_time += perf_counter() - started
+    parallel_search.shutdown()
+
+    print(f'{len(positions)} positions at depth {args.depth}')
+    print(f'single process: {single_time:.2f} s')
+    print(f'{args.workers} workers: {parallel_time:.2f} s')
+    print(f'speedup: {single_time / parallel_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,586 @@
+from typing import NamedTuple
+
+from checkers.enums import CheckerType, SideType
+from checkers.checker import Checker
+from checkers.move import Move
+from checkers.zobrist import ZobristKeys
+
+
+class BoardGeometry:
+    """Mapping between field cells and bits of the playable (dark) cells
+
+    Cells are numbered as if every row had one extra "ghost" column, so that
+    for an even field width W every diagonal step is a constant bit shift:
+    W // 2 + 1 and W // 2 for the two diagonals. Steps that leave the field
+    land on a ghost bit or outside the board and are removed by `mask`.
+    """
+
+    __cache = {}
+
+    def __init__(self, x_size: int, y_size: int):
+        if (x_size % 2):
+            raise ValueError('Bitboard field requires an even x size')
+
+        self.x_size = x_size
+        self.y_size = y_size
+
+        half = x_size // 2
+
+        # Bit shifts in the order of MOVE_OFFSETS: up-left, up-right, down-left, down-right
+        self.directions = (-(half + 1), -half, half, half + 1)
+        self.forward_directions = {
+            SideType.WHITE: self.directions[:2],
+            SideType.BLACK: self.directions[2:]
+        }
+
+        self.bit_at = [[-1] * x_size for y in range(y_size)]
+        self.coords = {}
+        self.mask = 0
+        for y in range(y_size):
+            for x in range(x_size):
+                if ((y + x) % 2):
+                    bit = ((x_size + 1) * y + x) // 2
+                    self.bit_at[y][x] = bit
+                    self.coords[bit] = (x, y)
+                    self.mask |= 1 << bit
+
+        # Rows of regular checkers of each side at the start, leaving two empty rows between them:
+        # 3 on 8x8, 4 on 10x10 (international draughts) and 5 on 12x12
+        self.start_rows = y_size // 2 - 1
+
+        self.promotion_masks = {
+            SideType.WHITE: self.row_mask(0),
+            SideType.BLACK: self.row_mask(y_size - 1)
+        }
+
+        # Moves are created once per field size and shared: moves[from_bit][to_bit]
+        self.moves = [{} for _ in range(max(self.coords) + 1)]
+        # Bits of the cells strictly between the ends of a move: between[from_bit][to_bit]
+        self.between = [{} for _ in range(max(self.coords) + 1)]
+        # (cell, move) pairs along every diagonal from every cell, nearest first: rays[from_bit][direction index]
+        self.rays = [()] * (max(self.coords) + 1)
+        for from_bit, from_coords in self.coords.items():
+            rays = []
+            for direction in self.directions:
+                ray = []
+                between = 0
+                cell = self.step(1 << from_bit, direction)
+                while (cell):
+                    to_bit = cell.bit_length() - 1
+                    move = Move(*from_coords, *self.coords[to_bit])
+                    self.moves[from_bit][to_bit] = move
+                    self.between[from_bit][to_bit] = between
+                    ray.append((cell, move))
+                    between |= cell
+                    cell = self.step(cell, direction)
+                rays.append(tuple(ray))
+            self.rays[from_bit] = tuple(rays)
+
+    @classmethod
+    def of(cls, x_size: int, y_size: int) -> 'BoardGeometry':
+        """Getting the (shared) geometry of a field size"""
+        key = (x_size, y_size)
+        if (key not in cls.__cache):
+            cls.__cache[key] = cls(x_size, y_size)
+        return cls.__cache[key]
+
+    def row_mask(self, y: int) -> int:
+        """Getting the bits of the playable cells of a row"""
+        return sum(1 << bit for bit in self.bit_at[y] if bit >= 0)
+
+    def step(self, bits: int, direction: int) -> int:
+        """Shifting every bit one cell in the direction"""
+        if (direction > 0):
+            return (bits << direction) & self.mask
+        return (bits >> -direction) & self.mask
+
+
+class BitboardUndo(NamedTuple):
+    """Record needed to take a move back"""
+    captured_white: int
+    captured_black: int
+    captured_queens: int
+    promoted: bool
+    zobrist_hash: int
+
+    @property
+    def has_captured(self) -> bool:
+        return bool(self.captured_white or self.captured_black)
+
+
+class BitboardTurn(NamedTuple):
+    """Whole turn of a side: one move, or every jump of a multi-capture, made and taken back at once"""
+    moves: tuple[Move, ...]
+    # Bits of all the checkers captured in the turn
+    captured: int = 0
+    # The regular checker became a queen during the turn
+    promoted: bool = False
+
+
+class BitboardChecker(Checker):
+    """Checker bound to a cell of a bitboard field"""
+
+    def __init__(self, field: 'BitboardField', x: int, y: int):
+        self.__field = field
+        self.__x = x
+        self.__y = y
+
+    @property
+    def type(self):
+        return self.__field.type_at(self.__x, self.__y)
+
+    def change_type(self, type: CheckerType):
+        """Changing the checker type"""
+        self.__field.set_type_at(self.__x, self.__y, type)
+
+
+class BitboardField:
+    """Field storing the playable cells as bitmasks of white, black and queen checkers"""
+
+    def __init__(self, x_size: int, y_size: int):
+        self.__geometry = BoardGeometry.of(x_size, y_size)
+        self.__zobrist = ZobristKeys.of(self.__geometry.mask.bit_length())
+        self.__generate()
+
+    @property
+    def x_size(self) -> int:
+        return self.__geometry.x_size
+
+    @property
+    def y_size(self) -> int:
+        return self.__geometry.y_size
+
+    @property
+    def size(self) -> int:
+        return max(self.x_size, self.y_size)
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        return self.__geometry
+
+    @property
+    def white(self) -> int:
+        return self.__white
+
+    @property
+    def black(self) -> int:
+        return self.__black
+
+    @property
+    def queens(self) -> int:
+        return self.__queens
+
+    @property
+    def zobrist(self) -> ZobristKeys:
+        return self.__zobrist
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Hash of the checkers placement, kept up to date as the field changes"""
+        return self.__zobrist_hash
+
+    @classmethod
+    def copy(cls, field_instance):
+        """Creates a copy of the field from the sample"""
+        field_copy = cls(field_instance.x_size, field_instance.y_size)
+
+        if isinstance(field_instance, BitboardField):
+            field_copy.__white = field_instance.__white
+            field_copy.__black = field_instance.__black
+            field_copy.__queens = field_instance.__queens
+            field_copy.__zobrist_hash = field_instance.__zobrist_hash
+            field_copy.__counts = list(field_instance.__counts)
+        else:
+            for y in range(field_instance.y_size):
+                for x in range(field_instance.x_size):
+                    field_copy.set_type_at(x, y, field_instance.type_at(x, y))
+
+        return field_copy
+
+    def snapshot(self) -> tuple:
+        """Getting a compact picklable description of the field"""
+        return self.x_size, self.y_size, self.__white, self.__black, self.__queens
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple) -> 'BitboardField':
+        """Creates a field from its snapshot"""
+        x_size, y_size, white, black, queens = snapshot
+        field = cls(x_size, y_size)
+        field.__white, field.__black, field.__queens = white, black, queens
+        field.__rehash()
+        field.__recount()
+
+        return field
+
+    def __generate(self):
+        self.__white = self.__black = self.__queens = 0
+
+        start_rows = self.__geometry.start_rows
+        for y in range(self.y_size):
+            if (y < start_rows):
+                self.__black |= self.__geometry.row_mask(y)
+            elif (y >= self.y_size - start_rows):
+                self.__white |= self.__geometry.row_mask(y)
+
+        self.__rehash()
+        self.__recount()
+
+    def __rehash(self):
+        self.__zobrist_hash = 0
+        cells = self.__white | self.__black
+        while (cells):
+            cell = cells & -cells
+            cells ^= cell
+            self.__zobrist_hash ^= self.__cell_key(cell.bit_length() - 1)
+
+    def __recount(self):
+        # Numbers of white checkers, black checkers, white queens and black queens,
+        # kept up to date as moves are made and taken back
+        self.__counts = [bin(self.__white).count('1'), bin(self.__black).count('1'),
+                         bin(self.__white & self.__queens).count('1'), bin(self.__black & self.__queens).count('1')]
+
+    def __cell_key(self, bit: int) -> int:
+        """Getting the zobrist key of the checker on the cell (0 for an empty cell)"""
+        cell = 1 << bit
+        if (self.__white & cell):
+            keys = self.__zobrist.white_queen if self.__queens & cell else self.__zobrist.white_regular
+        elif (self.__black & cell):
+            keys = self.__zobrist.black_queen if self.__queens & cell else self.__zobrist.black_regular
+        else:
+            return 0
+        return keys[bit]
+
+    def type_at(self, x: int, y: int) -> CheckerType:
+        """Getting the type of checkers on the field by coordinates"""
+        bit = self.__geometry.bit_at[y][x]
+        if (bit < 0):
+            return CheckerType.NONE
+
+        cell = 1 << bit
+        if (self.__white & cell):
+            return CheckerType.WHITE_QUEEN if self.__queens & cell else CheckerType.WHITE_REGULAR
+        if (self.__black & cell):
+            return CheckerType.BLACK_QUEEN if self.__queens & cell else CheckerType.BLACK_REGULAR
+        return CheckerType.NONE
+
+    def set_type_at(self, x: int, y: int, type: CheckerType):
+        """Placing a checker of the type on the field by coordinates"""
+        bit = self.__geometry.bit_at[y][x]
+        if (bit < 0):
+            if (type == CheckerType.NONE): return
+            raise ValueError(f'Cell {x}-{y} is not playable')
+
+        cell = 1 << bit
+        self.__zobrist_hash ^= self.__cell_key(bit)
+        self.__white &= ~cell
+        self.__black &= ~cell
+        self.__queens &= ~cell
+
+        if (type in (CheckerType.WHITE_REGULAR, CheckerType.WHITE_QUEEN)):
+            self.__white |= cell
+        elif (type in (CheckerType.BLACK_REGULAR, CheckerType.BLACK_QUEEN)):
+            self.__black |= cell
+
+        if (type in (CheckerType.WHITE_QUEEN, CheckerType.BLACK_QUEEN)):
+            self.__queens |= cell
+        self.__zobrist_hash ^= self.__cell_key(bit)
+        self.__recount()
+
+    def at(self, x: int, y: int) -> Checker:
+        """Getting checkers on the field by coordinates"""
+        return BitboardChecker(self, x, y)
+
+    def is_within(self, x: int, y: int) -> bool:
+        """Determines whether a point lies within the field"""
+        return (0 <= x < self.x_size and 0 <= y < self.y_size)
+
+    def __sides(self, side: SideType) -> tuple[int, int]:
+        if (side == SideType.WHITE):
+            return self.__white, self.__black
+        elif (side == SideType.BLACK):
+            return self.__black, self.__white
+        raise ValueError()
+
+    def captured_cells(self, move: Move) -> int:
+        """Getting the bits of the checkers jumped over by the move"""
+        bit_at = self.__geometry.bit_at
+        between = self.__geometry.between[bit_at[move.from_y][move.from_x]][bit_at[move.to_y][move.to_x]]
+        return between & (self.__white | self.__black)
+
+    def make_move(self, move: Move) -> BitboardUndo:
+        """Making a move, returns the record to take it back with"""
+        geometry = self.__geometry
+        from_bit = geometry.bit_at[move.from_y][move.from_x]
+        to_bit = geometry.bit_at[move.to_y][move.to_x]
+        from_cell = 1 << from_bit
+
+        if (self.__white & from_cell):
+            promotion_mask = geometry.promotion_masks[SideType.WHITE]
+        else:
+            promotion_mask = geometry.promotion_masks[SideType.BLACK]
+        # Changing the type of checker if it has reached the edge
+        promoted = bool(1 << to_bit & promotion_mask and not self.__queens & from_cell)
+
+        return self.__make(from_bit, to_bit, self.captured_cells(move), promoted)
+
+    def unmake_move(self, move: Move, undo: BitboardUndo):
+        """Taking back the last move made"""
+        bit_at = self.__geometry.bit_at
+        self.__unmake(bit_at[move.from_y][move.from_x], bit_at[move.to_y][move.to_x], undo)
+
+    def make_turn(self, turn: BitboardTurn) -> BitboardUndo:
+        """Making all the moves of the turn at once, returns the record to take it back with"""
+        bit_at = self.__geometry.bit_at
+        first, last = turn.moves[0], turn.moves[-1]
+        return self.__make(bit_at[first.from_y][first.from_x], bit_at[last.to_y][last.to_x], turn.captured,
+                           turn.promoted)
+
+    def unmake_turn(self, turn: BitboardTurn, undo: BitboardUndo):
+        """Taking back the last turn made"""
+        bit_at = self.__geometry.bit_at
+        first, last = turn.moves[0], turn.moves[-1]
+        self.__unmake(bit_at[first.from_y][first.from_x], bit_at[last.to_y][last.to_x], undo)
+
+    def __make(self, from_bit: int, to_bit: int, captured: int, promoted: bool) -> BitboardUndo:
+        """Moving the checker, removing the captured ones and promoting it"""
+        from_cell = 1 << from_bit
+        to_cell = 1 << to_bit
+        # A multi-capture may end on the cell it started from
+        moved = from_cell ^ to_cell
+        undo_zobrist_hash = self.__zobrist_hash
+
+        # Taking the moving and the eaten checkers out of the hash
+        self.__zobrist_hash ^= self.__cell_key(from_bit)
+        cells = captured
+        while (cells):
+            cell = cells & -cells
+            cells ^= cell
+            self.__zobrist_hash ^= self.__cell_key(cell.bit_length() - 1)
+
+        undo = BitboardUndo(captured & self.__white, captured & self.__black, captured & self.__queens, promoted,
+                            undo_zobrist_hash)
+
+        # Removing eaten checkers first, a multi-capture may end on the cell of one of them
+        self.__white &= ~captured
+        self.__black &= ~captured
+        self.__queens &= ~captured
+
+        if (self.__white & from_cell):
+            self.__white ^= moved
+        else:
+            self.__black ^= moved
+
+        # Moving the queen flag along with the checker
+        if (self.__queens & from_cell):
+            self.__queens ^= moved
+        elif (promoted):
+            self.__queens |= to_cell
+
+        self.__zobrist_hash ^= self.__cell_key(to_bit)
+        self.__count_move(undo, bool(self.__white & to_cell), -1)
+
+        return undo
+
+    def __unmake(self, from_bit: int, to_bit: int, undo: BitboardUndo):
+        from_cell = 1 << from_bit
+        to_cell = 1 << to_bit
+        moved = from_cell ^ to_cell
+
+        if (self.__white & to_cell):
+            self.__white ^= moved
+        else:
+            self.__black ^= moved
+
+        if (self.__queens & to_cell):
+            self.__queens ^= to_cell
+            if not (undo.promoted):
+                self.__queens |= from_cell
+
+        # Returning eaten checkers
+        self.__white |= undo.captured_white
+        self.__black |= undo.captured_black
+        self.__queens |= undo.captured_queens
+
+        self.__zobrist_hash = undo.zobrist_hash
+        self.__count_move(undo, bool(self.__white & from_cell), 1)
+
+    def __count_move(self, undo: BitboardUndo, is_white: bool, sign: int):
+        """Updating the counters by the eaten and promoted checkers (-1 to make the move, 1 to take it back)"""
+        counts = self.__counts
+        if (undo.captured_white or undo.captured_black):
+            counts[0] += sign * bin(undo.captured_white).count('1')
+            counts[1] += sign * bin(undo.captured_black).count('1')
+            if (undo.captured_queens):
+                counts[2] += sign * bin(undo.captured_white & undo.captured_queens).count('1')
+                counts[3] += sign * bin(undo.captured_black & undo.captured_queens).count('1')
+
+        if (undo.promoted):
+            counts[2 if is_white else 3] -= sign
+
+    def moves(self, side: SideType) -> list[Move]:
+        """Getting a list of moves"""
+        moves_list = self.required_moves(side)
+        if not (moves_list):
+            moves_list = self.optional_moves(side)
+        return moves_list
+
+    def required_moves(self, side: SideType, x: int = -1, y: int = -1) -> list[Move]:
+        """Getting a list of required moves (only of the checker at x, y if given)"""
+        moves_list = []
+        geometry = self.__geometry
+        moves = geometry.moves
+        step = geometry.step
+
+        friendly, enemy = self.__sides(side)
+        if (x >= 0 and y >= 0):
+            friendly &= 1 << geometry.bit_at[y][x]
+        empty = geometry.mask & ~(self.__white | self.__black)
+        regular = friendly & ~self.__queens
+
+        # Regular checkers capture in every direction, all of them at once
+        for direction in geometry.directions:
+            landings = step(step(regular, direction) & enemy, direction) & empty
+            while (landings):
+                cell = landings & -landings
+                landings ^= cell
+                to_bit = cell.bit_length() - 1
+                moves_list.append(moves[to_bit - 2 * direction][to_bit])
+
+        # Queens fly along the diagonal, jump one enemy checker and land on any free cell behind it
+        queens = friendly & self.__queens
+        while (queens):
+            queen = queens & -queens
+            queens ^= queen
+
+            for ray in geometry.rays[queen.bit_length() - 1]:
+                ray = iter(ray)
+                # The first occupied cell of the diagonal
+                for cell, move in ray:
+                    if not (cell & empty): break
+                else:
+                    continue
+                if not (cell & enemy): continue
+
+                for cell, move in ray:
+                    if not (cell & empty): break
+                    moves_list.append(move)
+
+        return moves_list
+
+    def optional_moves(self, side: SideType) -> list[Move]:
+        """Getting a list of optional moves"""
+        moves_list = []
+        geometry = self.__geometry
+        moves = geometry.moves
+        step = geometry.step
+
+        friendly, enemy = self.__sides(side)
+        empty = geometry.mask & ~(self.__white | self.__black)
+        regular = friendly & ~self.__queens
+
+        # Regular checkers move one cell forward
+        for direction in geometry.forward_directions[side]:
+            targets = step(regular, direction) & empty
+            while (targets):
+                cell = targets & -targets
+                targets ^= cell
+                to_bit = cell.bit_length() - 1
+                moves_list.append(moves[to_bit - direction][to_bit])
+
+        # Queens move to any free cell along the diagonal
+        queens = friendly & self.__queens
+        while (queens):
+            queen = queens & -queens
+            queens ^= queen
+
+            for ray in geometry.rays[queen.bit_length() - 1]:
+                for cell, move in ray:
+                    if not (cell & empty): break
+                    moves_list.append(move)
+
+        return moves_list
+
+    def has_optional_moves(self, side: SideType) -> bool:
+        """Checking whether the side has an optional move, without generating the moves"""
+        geometry = self.__geometry
+        step = geometry.step
+
+        friendly, _ = self.__sides(side)
+        empty = geometry.mask & ~(self.__white | self.__black)
+        regular = friendly & ~self.__queens
+        left, right = geometry.forward_directions[side]
+        if ((step(regular, left) | step(regular, right)) & empty):
+            return True
+
+        # A queen that can't step to a neighbouring cell can't fly further either
+        queens = friendly & self.__queens
+        if (queens):
+            for direction in geometry.directions:
+                if (step(queens, direction) & empty):
+                    return True
+
+        return False
+
+    def turns(self, side: SideType) -> list[BitboardTurn]:
+        """Getting a list of whole turns"""
+        turns_list = self.required_turns(side)
+        if not (turns_list):
+            turns_list = self.optional_turns(side)
+        return turns_list
+
+    def required_turns(self, side: SideType) -> list[BitboardTurn]:
+        """Getting a list of capturing turns, one for every way of capturing to the end"""
+        turns_list = []
+        for move in self.required_moves(side):
+            self.__add_capture_turns(side, (move,), 0, False, turns_list)
+        return turns_list
+
+    def optional_turns(self, side: SideType) -> list[BitboardTurn]:
+        """Getting a list of turns of one optional move"""
+        bit_at = self.__geometry.bit_at
+        promotion_mask = self.__geometry.promotion_masks[side]
+        return [BitboardTurn((move,), 0, bool(1 << bit_at[move.to_y][move.to_x] & promotion_mask and
+                                              not self.__queens & 1 << bit_at[move.from_y][move.from_x]))
+                for move in self.optional_moves(side)]
+
+    def __add_capture_turns(self, side: SideType, moves: tuple[Move, ...], captured: int, promoted: bool,
+                            turns_list: list[BitboardTurn]):
+        """Following the jumps of the checker from the last of the moves down to the ends of the multi-captures"""
+        move = moves[-1]
+        undo = self.make_move(move)
+        captured |= undo.captured_white | undo.captured_black
+        promoted = promoted or undo.promoted
+
+        # Only the checker that has just captured may go on capturing
+        required_moves_list = self.required_moves(side, move.to_x, move.to_y)
+        if (required_moves_list):
+            for next_move in required_moves_list:
+                self.__add_capture_turns(side, moves + (next_move,), captured, promoted, turns_list)
+        else:
+            turns_list.append(BitboardTurn(moves, captured, promoted))
+
+        self.unmake_move(move, undo)
+
+    @property
+    def white_checkers_count(self) -> int:
+        return self.__counts[0]
+
+    @property
+    def black_checkers_count(self) -> int:
+        return self.__counts[1]
+
+    @property
+    def white_queens_count(self) -> int:
+        return self.__counts[2]
+
+    @property
+    def black_queens_count(self) -> int:
+        return self.__counts[3]
+
+    @property
+    def white_score(self) -> int:
+        return self.__counts[0] + self.__counts[2] * 2
+
+    @property
+    def black_score(self) -> int:
+        return self.__counts[1] + self.__counts[3] * 2
@@ -0,0 +1,205 @@
+"""Opening book: turns to play in known positions without searching
+
+The book is a sorted binary file of (position hash, move, weight) records,
+read through mmap and searched by binary search, so nothing is parsed when
+it is opened. A multi-capture takes a record per jump, keyed by the position
+before the jump.
+
+Build it from self-play and, optionally, games in text form (one game per
+line, moves such as '2,5-3,4' separated by spaces), from the repository root:
+    python -m checkers.book --games 200 --turns 10 --engine time=0.5
+"""
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from struct import Struct
+import mmap
+import os
+
+from checkers.rules import Position
+from checkers.search import Search
+from checkers.transposition import TranspositionTable
+from checkers.tournament import EngineConfig
+from checkers.move import Move
+from checkers.enums import GameResult
+from checkers.constants import X_SIZE, Y_SIZE, MAX_PREDICTION_DEPTH
+
+# File of the opening book used by the bot
+OPENING_BOOK_PATH = 'openingBook.bin'
+
+BOOK_MAGIC = b'CKBK'
+# Magic, field size and number of records
+BOOK_HEADER = Struct('<4sHHQ')
+# Position hash, move and weight
+BOOK_RECORD = Struct('<QIH')
+MAX_WEIGHT = 0xffff
+
+
+class OpeningBook:
+    """Read-only opening book mapped into memory"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            # The mapping stays valid once the file is closed
+            self.__data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.__x_size, self.__y_size, self.__count = BOOK_HEADER.unpack_from(self.__data)
+        if (magic != BOOK_MAGIC or len(self.__data) != BOOK_HEADER.size + self.__count * BOOK_RECORD.size):
+            self.__data.close()
+            raise ValueError(f'{path} is not an opening book')
+
+    @classmethod
+    def load(cls, path: str = OPENING_BOOK_PATH) -> 'OpeningBook':
+        """Opening the book if there is one, None otherwise"""
+        return cls(path) if os.path.exists(path) else None
+
+    @property
+    def count(self) -> int:
+        """Number of records"""
+        return self.__count
+
+    def entries(self, key: int) -> list[tuple[Move, int]]:
+        """Getting the (move, weight) records of the position hash"""
+        # The first record with the hash or a greater one
+        low, high = 0, self.__count
+        while (low < high):
+            middle = (low + high) // 2
+            if (self.__key_at(middle) < key):
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        for index in range(low, self.__count):
+            record_key, move_code, weight = BOOK_RECORD.unpack_from(self.__data, self.__offset(index))
+            if (record_key != key): break
+            entries.append((decode_move(move_code), weight))
+
+        return entries
+
+    def probe(self, position: Position, random: Random) -> list[Move]:
+        """Picking a turn for the side to move by the weights, None if the book doesn't know the whole turn"""
+        if (position.field.x_size != self.__x_size or position.field.y_size != self.__y_size):
+            return None
+
+        position = Position.copy(position)
+        moves = []
+        while True:
+            # Hash collisions are ruled out by checking that the move is legal
+            entries = [(move, weight) for move, weight in self.entries(position.zobrist_hash)
+                       if position.is_legal(move)]
+            if not (entries):
+                return None
+
+            move = random.choices([move for move, _ in entries], [weight for _, weight in entries])[0]
+            moves.append(move)
+            position.make_move(move)
+
+            # The turn goes on while the checker keeps capturing
+            if not (position.capturing_cell):
+                return moves
+
+    def close(self):
+        self.__data.close()
+
+    def __key_at(self, index: int) -> int:
+        return BOOK_RECORD.unpack_from(self.__data, self.__offset(index))[0]
+
+    @staticmethod
+    def __offset(index: int) -> int:
+        return BOOK_HEADER.size + index * BOOK_RECORD.size
+
+
+def encode_move(move: Move) -> int:
+    return move.from_x | move.from_y << 8 | move.to_x << 16 | move.to_y << 24
+
+
+def decode_move(code: int) -> Move:
+    return Move(code & 0xff, code >> 8 & 0xff, code >> 16 & 0xff, code >> 24 & 0xff)
+
+
+def parse_move(text: str) -> Move:
+    """Parsing a move such as '2,5-3,4'"""
+    from_cell, to_cell = text.split('-')
+    from_x, from_y = map(int, from_cell.split(','))
+    to_x, to_y = map(int, to_cell.split(','))
+    return Move(from_x, from_y, to_x, to_y)
+
+
+def format_move(move: Move) -> str:
+    """Getting the text of a move, such as '2,5-3,4'"""
+    return f'{move.from_x},{move.from_y}-{move.to_x},{move.to_y}'
+
+
+def write_book(path: str, x_size: int, y_size: int, weights: Counter):
+    """Writing the book from the weights of (position hash, move code) pairs"""
+    records = sorted(weights.items())
+    with open(path, 'wb') as file:
+        file.write(BOOK_HEADER.pack(BOOK_MAGIC, x_size, y_size, len(records)))
+        for (key, move_code), weight in records:
+            file.write(BOOK_RECORD.pack(key, move_code, min(weight, MAX_WEIGHT)))
+
+
+def add_game(weights: Counter, moves: list[Move], turns: int, x_size: int = X_SIZE, y_size: int = Y_SIZE):
+    """Adding the moves of the first turns of a game to the weights"""
+    position = Position(x_size, y_size)
+    for move in moves:
+        if (turns <= 0 or position.result != GameResult.IN_PROGRESS): break
+        if not (position.is_legal(move)):
+            raise ValueError(f'Illegal move {move} in {position.to_string()}')
+
+        weights[position.zobrist_hash, encode_move(move)] += 1
+        position.make_move(move)
+        if not (position.capturing_cell):
+            turns -= 1
+
+
+def self_play_game(engine: EngineConfig, seed: int, turns: int) -> list[Move]:
+    """Getting the moves of the first turns of a game the engine plays against itself"""
+    search = Search(engine.depth or MAX_PREDICTION_DEPTH, TranspositionTable(engine.tt_size_mb), seed)
+    position = Position(X_SIZE, Y_SIZE)
+
+    moves = []
+    for _ in range(turns):
+        if (position.result != GameResult.IN_PROGRESS): break
+        search_result = search.search(position.field, position.side, time_limit=engine.time_limit,
+                                      node_limit=engine.node_limit)
+        for move in search_result.moves:
+            position.make_move(move)
+        moves += search_result.moves
+
+    return moves
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100, help='number of self-play games')
+    parser.add_argument('--turns', type=int, default=10, help='number of turns of each game put in the book')
+    parser.add_argument('--engine', default='depth=8', help="settings such as 'depth=8,time=0.5,tt=16'")
+    parser.add_argument('--import', dest='import_path', help='file of games to add')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default=OPENING_BOOK_PATH)
+    args = parser.parse_args()
+
+    weights = Counter()
+
+    if (args.import_path):
+        with open(args.import_path) as file:
+            for line in file:
+                if (line.strip()):
+                    add_game(weights, [parse_move(text) for text in line.split()], args.turns)
+
+    engine = EngineConfig.parse(args.engine)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(self_play_game, engine, args.seed + game, args.turns) for game in range(args.games)]
+        for future in futures:
+            add_game(weights, future.result(), args.turns)
+
+    write_book(args.output, X_SIZE, Y_SIZE, weights)
+    print(f'{len(weights)} records written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
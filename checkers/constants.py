@@ -6,14 +6,43 @@ PLAYER_SIDE = SideType.WHITE
 
 # Field size
 X_SIZE = Y_SIZE = 8
+# Field sizes a game can be played on: 8x8, 10x10 (international draughts) and 12x12
+BOARD_SIZES = (8, 10, 12)
 # Cell size (in pixels)
 CELL_SIZE = 75
+# Largest side of the board on the screen (in pixels)
+MAX_BOARD_PIXELS = 8 * CELL_SIZE
+# Keeping the checkers images scaled to the cell size on disk for the next start
+CACHE_SCALED_IMAGES = True
 
-# Animation speed (more = faster)
+# Animation speed (cells per second)
 ANIMATION_SPEED = 4
+# Interval between animation frames (in milliseconds)
+ANIMATION_FRAME_INTERVAL = 16
 
-# Number of moves to predict
-MAX_PREDICTION_DEPTH = 3
+# Maximum number of moves to predict
+MAX_PREDICTION_DEPTH = 32
+# Time the bot may think over a move (in seconds)
+MOVE_TIME_LIMIT = 1.0
+# Number of positions the bot may search over a move (0 for no limit)
+MOVE_NODE_LIMIT = 0
+# Number of processes the bot's search is split between
+SEARCH_WORKERS = 1
+# Interval of checking whether the bot has worked out its move (in milliseconds)
+SEARCH_POLL_INTERVAL = 20
+# File the stats of every bot move are appended to as JSON lines (None for no log)
+SEARCH_LOG_PATH = None
+# Path prefix of the cProfile dumps of every bot move (None for no profiling)
+SEARCH_PROFILE_PATH = None
+# Whether to measure the time of move generation, making turns and evaluation (slows the search down)
+SEARCH_MEASURE_TIMES = False
+# Whether the bot searches its reply to the predicted player's move while the player thinks
+PONDERING = True
+# Longest time the bot ponders over the player's move (in seconds)
+PONDER_TIME_LIMIT = 60.0
+
+# Memory budget of the bot's transposition table (in megabytes)
+TRANSPOSITION_TABLE_SIZE_MB = 16
 
 BORDER_WIDTH = 2 * 2
 
@@ -0,0 +1,233 @@
+"""Engine process driven by a text protocol over stdin/stdout or TCP
+
+Commands, one per line:
+    isready                                   answered with 'readyok'
+    newgame                                   forgets the positions searched so far
+    position startpos [10x10] [moves 2,5-3,4 ...]
+                                              the start position (8x8 by default) with moves played from it
+    position fen <side> <rows> [moves ...]    a position in the notation of `Position.to_string`
+    go [depth N] [time S] [nodes N]           searches the position, with no limits until 'stop'
+    stop                                      makes the running and queued searches answer at once
+    quit
+
+Every search is answered with
+    info depth D score S nodes N nps N pv <moves>
+    bestmove <moves of the whole turn>        or 'bestmove none' when the side has no moves
+and a wrong command with 'error <message>'.
+
+Searches of a session are queued and run one after another in the background,
+so 'stop' and other commands are read while a search runs. Over TCP every
+connection is a session of its own with its own transposition table, for example:
+    python -m checkers.engine --tcp --port 7400
+"""
+from argparse import ArgumentParser
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+import asyncio
+import sys
+
+from checkers.book import parse_move, format_move
+from checkers.rules import Position
+from checkers.search import Search
+from checkers.tablebase import Tablebase
+from checkers.transposition import TranspositionTable
+from checkers.constants import X_SIZE, Y_SIZE, BOARD_SIZES, MAX_PREDICTION_DEPTH
+
+ENGINE_HOST = '127.0.0.1'
+ENGINE_PORT = 7400
+# Memory budget of the transposition table of every session (in megabytes)
+ENGINE_TT_SIZE_MB = 16
+
+
+class EngineError(ValueError):
+    """Wrong command of the protocol"""
+
+
+class EngineSession:
+    """State of one protocol session: the position and its queue of searches
+
+    `send` gets the lines of the answers, also from the thread running the searches.
+    """
+
+    def __init__(self, send: Callable[[str], None], tablebase: Tablebase = None,
+                 tt_size_mb: float = ENGINE_TT_SIZE_MB):
+        self.__send = send
+        self.__search = Search(MAX_PREDICTION_DEPTH, TranspositionTable(tt_size_mb), tablebase=tablebase)
+        self.__position = Position(X_SIZE, Y_SIZE)
+        # Searches run one after another, in the order of the 'go' commands
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        # Stop events of the running and queued searches
+        self.__stop_events = set()
+        self.__stop_events_lock = Lock()
+
+    def handle(self, line: str) -> bool:
+        """Carrying out a command, False once the session is over"""
+        words = line.split()
+        if not (words):
+            return True
+
+        command, arguments = words[0], words[1:]
+        try:
+            if (command == 'quit'):
+                return False
+            elif (command == 'isready'):
+                # Answered after the searches queued before it
+                self.__executor.submit(self.__send, 'readyok')
+            elif (command == 'newgame'):
+                self.__executor.submit(self.__search.transposition_table.clear)
+            elif (command == 'position'):
+                self.__position = self.__parse_position(arguments)
+            elif (command == 'go'):
+                self.__go(arguments)
+            elif (command == 'stop'):
+                self.stop()
+            else:
+                raise EngineError(f'Unknown command {command!r}')
+        except (EngineError, ValueError, KeyError) as error:
+            self.__send(f'error {error}')
+
+        return True
+
+    def stop(self):
+        with self.__stop_events_lock:
+            for stop_event in self.__stop_events:
+                stop_event.set()
+
+    def close(self):
+        """Stopping the searches, the running one still answers and the queued ones are dropped"""
+        self.stop()
+        self.__executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def __parse_position(arguments: list[str]) -> Position:
+        if (arguments[:1] == ['startpos']):
+            x_size, y_size = X_SIZE, Y_SIZE
+            arguments = arguments[1:]
+            if (arguments and arguments[0] != 'moves'):
+                x_size, y_size = map(int, arguments[0].split('x'))
+                if not (x_size in BOARD_SIZES and y_size == x_size):
+                    raise EngineError(f'Unsupported field size {arguments[0]}')
+                arguments = arguments[1:]
+            position = Position(x_size, y_size)
+        elif (arguments[:1] == ['fen'] and len(arguments) >= 3):
+            position = Position.from_string(' '.join(arguments[1:3]))
+            arguments = arguments[3:]
+        else:
+            raise EngineError("The position is either 'startpos' or 'fen <side> <rows>'")
+
+        if (arguments):
+            if (arguments[0] != 'moves'):
+                raise EngineError(f'Unexpected {arguments[0]!r} after the position')
+            for text in arguments[1:]:
+                move = parse_move(text)
+                if not (position.is_legal(move)):
+                    raise EngineError(f'Illegal move {text}')
+                position.make_move(move)
+
+        return position
+
+    def __go(self, arguments: list[str]):
+        names = {'depth': int, 'time': float, 'nodes': int}
+        if (len(arguments) % 2):
+            raise EngineError(f'No value of {arguments[-1]!r}')
+        limits = {}
+        for name, value in zip(arguments[::2], arguments[1::2]):
+            if (name not in names):
+                raise EngineError(f'Unknown search limit {name!r}')
+            limits[name] = names[name](value)
+
+        if (self.__position.capturing_cell):
+            raise EngineError('The position is in the middle of a multi-capture')
+
+        stop_event = Event()
+        with self.__stop_events_lock:
+            self.__stop_events.add(stop_event)
+        self.__executor.submit(self.__run_search, Position.copy(self.__position), limits, stop_event)
+
+    def __run_search(self, position: Position, limits: dict, stop_event: Event):
+        try:
+            result = self.__search.search(position.field, position.side, limits.get('depth', 0),
+                                          limits.get('time', 0), limits.get('nodes', 0), stop_event)
+        finally:
+            with self.__stop_events_lock:
+                self.__stop_events.discard(stop_event)
+
+        stats = result.stats
+        self.__send(f'info depth {result.depth} score {result.score} nodes {result.nodes} '
+                    f'nps {round(stats.nodes_per_second)} pv ' + ' '.join(map(format_move, result.principal_variation)))
+        self.__send('bestmove ' + (' '.join(map(format_move, result.moves)) if result.moves else 'none'))
+
+
+def serve_stdio(tablebase: Tablebase = None):
+    """Serving one session over stdin and stdout until 'quit' or the end of the input"""
+    output_lock = Lock()
+
+    def send(text: str):
+        with output_lock:
+            print(text, flush=True)
+
+    session = EngineSession(send, tablebase)
+    try:
+        for line in sys.stdin:
+            if not (session.handle(line)):
+                break
+    finally:
+        session.close()
+
+
+async def serve_tcp(host: str = ENGINE_HOST, port: int = ENGINE_PORT, tablebase: Tablebase = None):
+    """Serving a session per connection until cancelled"""
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+
+        def write(data: bytes):
+            if not (writer.is_closing()):
+                writer.write(data)
+
+        def send(text: str):
+            try:
+                loop.call_soon_threadsafe(write, (text + '\n').encode())
+            except RuntimeError:
+                # The server is closed
+                pass
+
+        session = EngineSession(send, tablebase)
+        try:
+            while (line := await reader.readline()):
+                if not (session.handle(line.decode(errors='replace'))):
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # The answer of the stopped search is written by the loop, so it is not waited for in it
+            await loop.run_in_executor(None, session.close)
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tcp', action='store_true', help='serve TCP connections instead of stdin and stdout')
+    parser.add_argument('--host', default=ENGINE_HOST)
+    parser.add_argument('--port', type=int, default=ENGINE_PORT)
+    args = parser.parse_args()
+
+    # The tablebase files are mapped once and shared by the sessions
+    tablebase = Tablebase.load()
+    if (args.tcp):
+        try:
+            asyncio.run(serve_tcp(args.host, args.port, tablebase))
+        except KeyboardInterrupt:
+            pass
+    else:
+        serve_stdio(tablebase)
+
+
+if __name__ == '__main__':
+    main()
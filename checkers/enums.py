@@ -22,3 +22,10 @@ class CheckerType(Enum):
 class GameType(Enum):
     PVP = auto()
     PVE = auto()
+
+
+class GameResult(Enum):
+    IN_PROGRESS = auto()
+    WHITE_WINS = auto()
+    BLACK_WINS = auto()
+    DRAW = auto()
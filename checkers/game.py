@@ -1,471 +1,340 @@
 from tkinter import Canvas, Event, messagebox
-from PIL import Image, ImageTk
-from random import choice
-from pathlib import Path
-from time import sleep
-from math import inf
+from time import perf_counter
+from collections import deque
 
-from checkers.field import Field
+from checkers.rules import Position
 from checkers.move import Move
+from checkers.worker import BotWorker
+from checkers.leaderboard import LeaderboardWriter
+from checkers.sprites import load_sprites
 from checkers.constants import *
-from checkers.enums import CheckerType, SideType, GameType
+from checkers.enums import CheckerType, SideType, GameType, GameResult
 
-import checkers.leaderboard as lb
+
+def cell_size(x_field_size: int, y_field_size: int) -> int:
+    """Getting the size of the cells on the screen, larger fields get smaller cells to fit the board"""
+    return min(CELL_SIZE, MAX_BOARD_PIXELS // max(x_field_size, y_field_size))
 
 
 class Game:
-    def __init__(self, canvas: Canvas, x_field_size: int, y_field_size: int, player_names: dict, game_type: GameType):
+    def __init__(self, canvas: Canvas, x_field_size: int, y_field_size: int, player_names: dict, game_type: GameType,
+                 bot_worker: BotWorker = None, leaderboard_writer: LeaderboardWriter = None):
 
         self.__player_names = player_names
         self.__game_type = game_type
 
         self.__canvas = canvas
-        self.__field = Field(x_field_size, y_field_size)
+        self.__cell_size = cell_size(x_field_size, y_field_size)
+        # The rules of the game live in the position, the game only shows it and takes the player's input
+        self.__position = Position(x_field_size, y_field_size)
+        self.__field = self.__position.field
 
-        self.__player_turn = True
+        # The bot thinks in another process, its pending turn is polled from the Tk loop
+        self.__bot_worker = bot_worker or BotWorker()
+        self.__enemy_turn_future = None
 
-        self.__current_turn = SideType.WHITE
+        # Results are written to the leaderboard in the background
+        self.__leaderboard_writer = leaderboard_writer or LeaderboardWriter()
+
+        self.__player_turn = True
 
         self.__hovered_cell = Point()
         self.__selected_cell = Point()
-        self.__animated_cell = Point()
 
-        self.__init_images()
+        # Moves waiting to be animated with the cells' checkers types after each of them
+        self.__animations = deque()
+        # Animation in progress: checker image, start and end cells, start time, duration and the types after it
+        self.__animation = None
+        self.__animation_job = None
 
-        self.__draw()
+        # Images are loaded and scaled once per process
+        self.__images = load_sprites(self.__cell_size)
+        self.__create_items()
 
-        lb.create_table()
+        self.__draw()
 
         # If the player plays for the blacks, then make the opponent's move
         if (PLAYER_SIDE == SideType.BLACK):
             self.__handle_enemy_turn()
 
-    def __init_images(self):
-        self.__images = {
-            CheckerType.WHITE_REGULAR: ImageTk.PhotoImage(
-                Image.open(Path('images', 'red-regular.png')).resize((CELL_SIZE, CELL_SIZE), Image.ANTIALIAS)),
-            CheckerType.BLACK_REGULAR: ImageTk.PhotoImage(
-                Image.open(Path('images', 'black-regular.png')).resize((CELL_SIZE, CELL_SIZE), Image.ANTIALIAS)),
-            CheckerType.WHITE_QUEEN: ImageTk.PhotoImage(
-                Image.open(Path('images', 'red-queen.png')).resize((CELL_SIZE, CELL_SIZE), Image.ANTIALIAS)),
-            CheckerType.BLACK_QUEEN: ImageTk.PhotoImage(
-                Image.open(Path('images', 'black-queen.png')).resize((CELL_SIZE, CELL_SIZE), Image.ANTIALIAS)),
-        }
+    def __create_items(self):
+        """Creating the canvas items once, drawing later only changes them"""
+        self.__canvas.delete('all')
+
+        x_size, y_size = self.__field.x_size, self.__field.y_size
+        size = self.__cell_size
+        for y in range(y_size):
+            for x in range(x_size):
+                self.__canvas.create_rectangle(x * size, y * size, x * size + size, y * size + size,
+                                               fill=FIELD_COLORS[(y + x) % 2], width=0, tag='boards')
+
+        # Points of possible moves, one per cell
+        self.__move_circle_items = [[self.__canvas.create_oval(x * size + size / 3, y * size + size / 3,
+                                                               x * size + (size - size / 3),
+                                                               y * size + (size - size / 3),
+                                                               fill=POSIBLE_MOVE_CIRCLE_COLOR, width=0,
+                                                               state='hidden', tag='posible_move_circle')
+                                     for x in range(x_size)] for y in range(y_size)]
+        self.__drawn_move_circles = set()
+
+        # Frames of the selected and the hovered cells, moved from cell to cell
+        self.__select_border = self.__canvas.create_rectangle(0, 0, 0, 0, outline=SELECT_BORDER_COLOR,
+                                                              width=BORDER_WIDTH, state='hidden', tag='border')
+        self.__hover_border = self.__canvas.create_rectangle(0, 0, 0, 0, outline=HOVER_BORDER_COLOR,
+                                                             width=BORDER_WIDTH, state='hidden', tag='border')
+
+        # Checkers images, one per cell, hidden on empty cells
+        self.__checker_items = [[self.__canvas.create_image(x * size, y * size, anchor='nw',
+                                                            state='hidden', tag='checkers')
+                                 for x in range(x_size)] for y in range(y_size)]
+        self.__drawn_types = [[CheckerType.NONE] * x_size for _ in range(y_size)]
 
     def __animate_move(self, move: Move):
-        self.__animated_cell = Point(move.from_x, move.from_y)
-        self.__draw()
+        """Queueing the animation of a move already made on the field"""
+        self.__animations.append((move, self.__cell_types()))
+        if (self.__animation is None):
+            self.__start_animation()
+
+    def __start_animation(self):
+        move, types = self.__animations.popleft()
 
-        # Creating checkers for animation
-        animated_checker = self.__canvas.create_image(move.from_x * CELL_SIZE, move.from_y * CELL_SIZE,
-                                                      image=self.__images.get(
-                                                          self.__field.type_at(move.from_x, move.from_y)), anchor='nw',
-                                                      tag='animated_checker')
+        # The checker's own image is moved and put back once the move is shown
+        animated_checker = self.__checker_items[move.from_y][move.from_x]
+        self.__canvas.tag_raise(animated_checker)
 
-        # Motion vectors
-        dx = 1 if move.from_x < move.to_x else -1
-        dy = 1 if move.from_y < move.to_y else -1
+        duration = abs(move.from_x - move.to_x) / ANIMATION_SPEED
+        self.__animation = (animated_checker, move, perf_counter(), duration, types)
+        self.__animation_frame()
 
-        # Animation
-        for distance in range(abs(move.from_x - move.to_x)):
-            for _ in range(100 // ANIMATION_SPEED):
-                self.__canvas.move(animated_checker, ANIMATION_SPEED / 100 * CELL_SIZE * dx,
-                                   ANIMATION_SPEED / 100 * CELL_SIZE * dy)
-                self.__canvas.update()
-                sleep(0.01)
+    def __animation_frame(self):
+        """Placing the animated checker according to the time passed"""
+        animated_checker, move, started, duration, types = self.__animation
+        progress = min(1.0, (perf_counter() - started) / duration) if duration else 1.0
 
-        self.__animated_cell = Point()
+        self.__canvas.coords(animated_checker, (move.from_x + (move.to_x - move.from_x) * progress) * self.__cell_size,
+                             (move.from_y + (move.to_y - move.from_y) * progress) * self.__cell_size)
+
+        if (progress < 1.0):
+            self.__animation_job = self.__canvas.after(ANIMATION_FRAME_INTERVAL, self.__animation_frame)
+        else:
+            self.__finish_animation()
+
+    def __finish_animation(self):
+        animated_checker, move, _, _, types = self.__animation
+        self.__canvas.coords(animated_checker, move.from_x * self.__cell_size, move.from_y * self.__cell_size)
+        self.__animation = self.__animation_job = None
+
+        if (self.__animations):
+            self.__draw_checkers(types)
+            self.__start_animation()
+        else:
+            self.__draw()
+
+    def __skip_animations(self):
+        """Showing the end of all the queued animations at once"""
+        if (self.__animation is None): return
+
+        self.__canvas.after_cancel(self.__animation_job)
+        self.__animations.clear()
+        self.__animation_job = None
+        animated_checker, move, *_ = self.__animation
+        self.__canvas.coords(animated_checker, move.from_x * self.__cell_size, move.from_y * self.__cell_size)
+        self.__animation = None
+
+        self.__draw()
+
+    def __cell_types(self) -> list[list[CheckerType]]:
+        return [[self.__field.type_at(x, y) for x in range(self.__field.x_size)] for y in range(self.__field.y_size)]
 
     def __draw(self):
-        """Displaying the grid of fields and checkers"""
-        self.__canvas.delete('all')
-        self.__draw_field_grid()
-        self.__draw_checkers()
+        """Bringing the checkers, frames and move points up to date, unless the moves are still being animated"""
+        if (self.__animation): return
 
-    def __draw_field_grid(self):
-        """Drawing a field grid"""
-        for y in range(self.__field.y_size):
-            for x in range(self.__field.x_size):
-                self.__canvas.create_rectangle(x * CELL_SIZE, y * CELL_SIZE, x * CELL_SIZE + CELL_SIZE,
-                                               y * CELL_SIZE + CELL_SIZE, fill=FIELD_COLORS[(y + x) % 2], width=0,
-                                               tag='boards')
-
-                # Drawing frames for the required cells
-                if (x == self.__selected_cell.x and y == self.__selected_cell.y):
-                    self.__canvas.create_rectangle(x * CELL_SIZE + BORDER_WIDTH // 2, y * CELL_SIZE + BORDER_WIDTH // 2,
-                                                   x * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                                                   y * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                                                   outline=SELECT_BORDER_COLOR, width=BORDER_WIDTH, tag='border')
-                elif (x == self.__hovered_cell.x and y == self.__hovered_cell.y):
-                    self.__canvas.create_rectangle(x * CELL_SIZE + BORDER_WIDTH // 2, y * CELL_SIZE + BORDER_WIDTH // 2,
-                                                   x * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                                                   y * CELL_SIZE + CELL_SIZE - BORDER_WIDTH // 2,
-                                                   outline=HOVER_BORDER_COLOR, width=BORDER_WIDTH, tag='border')
-
-                # Displaying possible move points if there is a selected cell
-                if (self.__selected_cell):
-                    #player_moves_list = self.__get_moves_list(PLAYER_SIDE)
-                    player_moves_list = self.__get_moves_list(self.__current_turn)
-                    for move in player_moves_list:
-                        if (self.__selected_cell.x == move.from_x and self.__selected_cell.y == move.from_y):
-                            self.__canvas.create_oval(move.to_x * CELL_SIZE + CELL_SIZE / 3,
-                                                      move.to_y * CELL_SIZE + CELL_SIZE / 3,
-                                                      move.to_x * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
-                                                      move.to_y * CELL_SIZE + (CELL_SIZE - CELL_SIZE / 3),
-                                                      fill=POSIBLE_MOVE_CIRCLE_COLOR, width=0,
-                                                      tag='posible_move_circle')
-
-    def __draw_checkers(self):
-        '''Drawing checkers'''
+        self.__draw_checkers()
+        self.__draw_borders()
+        self.__draw_move_circles()
+
+    def __draw_borders(self):
+        """Moving frames to the selected and the hovered cells"""
+        selected, hovered = self.__selected_cell, self.__hovered_cell
+        self.__place_border(self.__select_border, selected)
+        # The selection frame wins over the hover one
+        self.__place_border(self.__hover_border,
+                            Point() if (hovered.x == selected.x and hovered.y == selected.y) else hovered)
+
+    def __place_border(self, border: int, cell: Point):
+        if not (self.__field.is_within(cell.x, cell.y)):
+            self.__canvas.itemconfigure(border, state='hidden')
+            return
+
+        size = self.__cell_size
+        self.__canvas.coords(border, cell.x * size + BORDER_WIDTH // 2, cell.y * size + BORDER_WIDTH // 2,
+                             cell.x * size + size - BORDER_WIDTH // 2, cell.y * size + size - BORDER_WIDTH // 2)
+        self.__canvas.itemconfigure(border, state='normal')
+
+    def __draw_move_circles(self):
+        """Displaying possible move points of the selected cell"""
+        move_circles = {(move.to_x, move.to_y) for move in self.__position.legal_moves()
+                        if (self.__selected_cell.x == move.from_x and self.__selected_cell.y == move.from_y)}
+
+        for x, y in self.__drawn_move_circles - move_circles:
+            self.__canvas.itemconfigure(self.__move_circle_items[y][x], state='hidden')
+        for x, y in move_circles - self.__drawn_move_circles:
+            self.__canvas.itemconfigure(self.__move_circle_items[y][x], state='normal')
+
+        self.__drawn_move_circles = move_circles
+
+    def __draw_checkers(self, types: list[list[CheckerType]] = None):
+        '''Changing the images of the cells whose checkers changed (the field's ones or the given types)'''
         for y in range(self.__field.y_size):
             for x in range(self.__field.x_size):
-                # Don't draw empty cells or animated checkers
-                if (self.__field.type_at(x, y) != CheckerType.NONE and not (
-                        x == self.__animated_cell.x and y == self.__animated_cell.y)):
-                    self.__canvas.create_image(x * CELL_SIZE, y * CELL_SIZE,
-                                               image=self.__images.get(self.__field.type_at(x, y)), anchor='nw',
-                                               tag='checkers')
+                checker_type = types[y][x] if types else self.__field.type_at(x, y)
+                if (checker_type == self.__drawn_types[y][x]): continue
+
+                self.__drawn_types[y][x] = checker_type
+                # Don't draw empty cells
+                if (checker_type == CheckerType.NONE):
+                    self.__canvas.itemconfigure(self.__checker_items[y][x], state='hidden')
+                else:
+                    self.__canvas.itemconfigure(self.__checker_items[y][x], image=self.__images.get(checker_type),
+                                                state='normal')
 
     def mouse_move(self, event: Event):
         """Mouse movement event"""
-        x, y = (event.x) // CELL_SIZE, (event.y) // CELL_SIZE
+        x, y = (event.x) // self.__cell_size, (event.y) // self.__cell_size
         if (x != self.__hovered_cell.x or y != self.__hovered_cell.y):
             self.__hovered_cell = Point(x, y)
 
-            # If the player's turn, then redraw
+            # If the player's turn, then move the hover frame
             if (self.__player_turn):
-                self.__draw()
+                self.__draw_borders()
 
     def mouse_down(self, event: Event):
         """Mouse click event"""
-        if self.__game_type == GameType.PVE:
-            if not (self.__player_turn): return
-
-            x, y = (event.x) // CELL_SIZE, (event.y) // CELL_SIZE
+        self.__skip_animations()
 
-            # If the point is not inside the field
-            if not (self.__field.is_within(x, y)): return
+        if not (self.__player_turn): return
 
-            if (PLAYER_SIDE == SideType.WHITE):
-                player_checkers = WHITE_CHECKERS
-            elif (PLAYER_SIDE == SideType.BLACK):
-                player_checkers = BLACK_CHECKERS
-            else:
-                return
-
-            # If you click on the player's checker, then select it
-            if (self.__field.type_at(x, y) in player_checkers):
-                self.__selected_cell = Point(x, y)
-                self.__draw()
-            elif (self.__player_turn):
-                move = Move(self.__selected_cell.x, self.__selected_cell.y, x, y)
+        x, y = (event.x) // self.__cell_size, (event.y) // self.__cell_size
 
-                # If you click on a cell that you can look like
-                if (move in self.__get_moves_list(PLAYER_SIDE)):
-                    self.__handle_player_turn(move)
+        # If the point is not inside the field
+        if not (self.__field.is_within(x, y)): return
 
-                    if not (self.__player_turn):
-                        self.__handle_enemy_turn()
+        if (self.__position.side == SideType.WHITE):
+            player_checkers = WHITE_CHECKERS
         else:
-            x, y = (event.x) // CELL_SIZE, (event.y) // CELL_SIZE
-            if not (self.__field.is_within(x, y)): return
-            if (self.__current_turn == SideType.WHITE):
-                player_checkers = WHITE_CHECKERS
-            elif (self.__current_turn == SideType.BLACK):
-                player_checkers = BLACK_CHECKERS
-            else:
-                return
-            if (self.__field.type_at(x, y) in player_checkers):
-                self.__selected_cell = Point(x, y)
-                self.__draw()
-            elif (self.__player_turn):
-                move = Move(self.__selected_cell.x, self.__selected_cell.y, x, y)
-
-                if (move in self.__get_moves_list(self.__current_turn)):
-                    self.__handle_player_turn(move)
+            player_checkers = BLACK_CHECKERS
 
+        # If you click on the player's checker, then select it
+        if (self.__field.type_at(x, y) in player_checkers):
+            self.__selected_cell = Point(x, y)
+            self.__draw_borders()
+            self.__draw_move_circles()
+        else:
+            move = Move(self.__selected_cell.x, self.__selected_cell.y, x, y)
 
+            # If you click on a cell that you can look like
+            if (self.__position.is_legal(move)):
+                self.__handle_player_turn(move)
 
-    def __handle_move(self, move: Move, draw: bool = True) -> bool:
+    def __handle_move(self, move: Move, draw: bool = True):
         '''Making a move'''
-        if (draw): self.__animate_move(move)
-
-        # Changing the type of checker if it has reached the edge
-        if (move.to_y == 0 and self.__field.type_at(move.from_x, move.from_y) == CheckerType.WHITE_REGULAR):
-            self.__field.at(move.from_x, move.from_y).change_type(CheckerType.WHITE_QUEEN)
-        elif (move.to_y == self.__field.y_size - 1 and self.__field.type_at(move.from_x,
-                                                                            move.from_y) == CheckerType.BLACK_REGULAR):
-            self.__field.at(move.from_x, move.from_y).change_type(CheckerType.BLACK_QUEEN)
-
-        # Changing the position of the checker
-        self.__field.at(move.to_x, move.to_y).change_type(self.__field.type_at(move.from_x, move.from_y))
-        self.__field.at(move.from_x, move.from_y).change_type(CheckerType.NONE)
-
-        # Motion vectors
-        dx = -1 if move.from_x < move.to_x else 1
-        dy = -1 if move.from_y < move.to_y else 1
+        # Moving the checker, promoting it, removing eaten checkers and passing the turn
+        self.__position.make_move(move)
 
-        # Removing eaten checkers
-        has_killed_checker = False
-        x, y = move.to_x, move.to_y
-        while (x != move.from_x or y != move.from_y):
-            x += dx
-            y += dy
-            if (self.__field.type_at(x, y) != CheckerType.NONE):
-                self.__field.at(x, y).change_type(CheckerType.NONE)
-                has_killed_checker = True
-
-        if (draw): self.__draw()
-
-        return has_killed_checker
+        # The field is ahead of the board on the screen until the animation ends
+        if (draw): self.__animate_move(move)
 
     def __handle_player_turn(self, move: Move):
         """Processing a player's turn"""
-        if self.__game_type == GameType.PVE:
-            self.__player_turn = False
-
-
-            # Was the checker killed
-            has_killed_checker = self.__handle_move(move)
-
-            required_moves_list = list(
-                filter(lambda required_move: move.to_x == required_move.from_x and move.to_y == required_move.from_y,
-                       self.__get_required_moves_list(PLAYER_SIDE)))
-
-            # If there is another move with the same checker
-            if (has_killed_checker and required_moves_list):
-                self.__player_turn = True
-
-            self.__selected_cell = Point()
-        else:
-            self.__current_turn = self.__current_turn.opposite()
-            has_killed_checker = self.__handle_move(move)
-
-            required_moves_list = list(
-                filter(lambda required_move: move.to_x == required_move.from_x and move.to_y == required_move.from_y,
-                       self.__get_required_moves_list(self.__current_turn.opposite())))
+        self.__handle_move(move)
+        self.__selected_cell = Point()
 
-            # If there is another move with the same checker
-            if (has_killed_checker and required_moves_list):
-                self.__current_turn = self.__current_turn.opposite()
+        if (self.__check_for_game_over()): return
 
-            self.__selected_cell = Point()
-        self.__check_for_game_over()
+        # The bot moves once the player's multi-capture is over
+        if (self.__game_type == GameType.PVE and self.__position.side != PLAYER_SIDE):
+            self.__handle_enemy_turn()
 
+    def __handle_enemy_turn(self):
+        """Starting to work out the opponent's move"""
+        self.__player_turn = False
 
+        future = self.__bot_worker.search(self.__field, self.__position.side, MOVE_TIME_LIMIT, MOVE_NODE_LIMIT)
+        self.__enemy_turn_future = future
+        self.__canvas.after(SEARCH_POLL_INTERVAL, self.__poll_enemy_turn, future)
 
+    def __poll_enemy_turn(self, future):
+        """Making the opponent's move once it is worked out"""
+        # The search was abandoned (the player resigned or a new game started)
+        if (future is not self.__enemy_turn_future): return
 
-    def __handle_enemy_turn(self):
-        """Working out the opponent's move"""
-        self.__player_turn = False
+        if not (future.done()):
+            self.__canvas.after(SEARCH_POLL_INTERVAL, self.__poll_enemy_turn, future)
+            return
 
-        optimal_moves_list = self.__predict_optimal_moves(SideType.opposite(PLAYER_SIDE))
+        self.__enemy_turn_future = None
 
-        for move in optimal_moves_list:
+        result = future.result()
+        for move in result.moves:
             self.__handle_move(move)
 
         self.__player_turn = True
 
-        self.__check_for_game_over()
+        if (self.__check_for_game_over()): return
 
-    def __check_for_game_over(self):
-        """Checking at the end of the game"""
-        game_over = False
+        # The bot thinks over its next move while the player thinks over the move it expects
+        if (PONDERING):
+            self.__bot_worker.ponder(self.__field, self.__position.side, result.principal_variation[len(result.moves):],
+                                     MOVE_NODE_LIMIT)
 
-        white_moves_list = self.__get_moves_list(SideType.WHITE)
-        if not (white_moves_list):
-            # White lost
-            answer = messagebox.showinfo('The end of the game', 'Black wins')
-            if self.__game_type == GameType.PVE:
-                lb.add_player(self.__player_names["white"], self.__field.white_score - self.__field.black_score)
-            else:
-                lb.add_player(self.__player_names["black"], self.__field.black_score)
-            game_over = True
+    def move_now(self):
+        """Making the bot move right away with the best move found so far"""
+        if (self.__enemy_turn_future):
+            self.__bot_worker.stop()
 
-        black_moves_list = self.__get_moves_list(SideType.BLACK)
-        if not (black_moves_list):
-            # Black lost
-            answer = messagebox.showinfo('The end of the game', 'White wins')
-            lb.add_player(self.__player_names["white"], self.__field.white_score)
-            game_over = True
-
-        if (game_over):
-            # Start new game
-            self.__init__(self.__canvas, self.__field.x_size, self.__field.y_size, self.__player_names, GameType.PVP)
-
-    def __predict_optimal_moves(self, side: SideType) -> list[Move]:
-        """Predict the optimal move"""
-        best_result = 0
-        optimal_moves = []
-        predicted_moves_list = self.__get_predicted_moves_list(side)
-
-        if (predicted_moves_list):
-            field_copy = Field.copy(self.__field)
-            for moves in predicted_moves_list:
-                for move in moves:
-                    self.__handle_move(move, draw=False)
-
-                try:
-                    if (side == SideType.WHITE):
-                        result = self.__field.white_score / self.__field.black_score
-                    elif (side == SideType.BLACK):
-                        result = self.__field.black_score / self.__field.white_score
-                except ZeroDivisionError:
-                    result = inf
-
-                if (result > best_result):
-                    best_result = result
-                    optimal_moves.clear()
-                    optimal_moves.append(moves)
-                elif (result == best_result):
-                    optimal_moves.append(moves)
-
-                self.__field = Field.copy(field_copy)
-
-        optimal_move = []
-        if (optimal_moves):
-            # Filtering moves
-            for move in choice(optimal_moves):
-                if (side == SideType.WHITE and self.__field.type_at(move.from_x, move.from_y) in BLACK_CHECKERS):
-                    break
-                elif (side == SideType.BLACK and self.__field.type_at(move.from_x, move.from_y) in WHITE_CHECKERS):
-                    break
-
-                optimal_move.append(move)
-
-        return optimal_move
-
-    def __get_predicted_moves_list(self, side: SideType, current_prediction_depth: int = 0,
-                                   all_moves_list: list[Move] = [], current_moves_list: list[Move] = [],
-                                   required_moves_list: list[Move] = []) -> list[Move]:
-        """Sort all possible moves"""
-
-        if (current_moves_list):
-            all_moves_list.append(current_moves_list)
+    def resign(self):
+        """The player (or the side to move in a game of two players) gives up"""
+        if (self.__game_type == GameType.PVE):
+            losing_side = PLAYER_SIDE
         else:
-            all_moves_list.clear()
+            losing_side = self.__position.side
 
-        if (required_moves_list):
-            moves_list = required_moves_list
-        else:
-            moves_list = self.__get_moves_list(side)
+        # Dropping the bot's pending turn
+        if (self.__enemy_turn_future):
+            self.__enemy_turn_future = None
+            self.__bot_worker.stop()
 
-        if (moves_list and current_prediction_depth < MAX_PREDICTION_DEPTH):
-            field_copy = Field.copy(self.__field)
-            for move in moves_list:
-                has_killed_checker = self.__handle_move(move, draw=False)
+        self.__finish_game(losing_side)
 
-                required_moves_list = list(filter(
-                    lambda required_move: move.to_x == required_move.from_x and move.to_y == required_move.from_y,
-                    self.__get_required_moves_list(side)))
+    def __check_for_game_over(self) -> bool:
+        """Checking at the end of the game"""
+        result = self.__position.result
+        if (result == GameResult.BLACK_WINS):
+            # White lost
+            self.__finish_game(SideType.WHITE)
+        elif (result == GameResult.WHITE_WINS):
+            # Black lost
+            self.__finish_game(SideType.BLACK)
 
-                # If there is another move with the same checker
-                if (has_killed_checker and required_moves_list):
-                    self.__get_predicted_moves_list(side, current_prediction_depth, all_moves_list,
-                                                    current_moves_list + [move], required_moves_list)
-                else:
-                    self.__get_predicted_moves_list(SideType.opposite(side), current_prediction_depth + 1,
-                                                    all_moves_list, current_moves_list + [move])
-
-                self.__field = Field.copy(field_copy)
-
-        return all_moves_list
-
-    def __get_moves_list(self, side: SideType) -> list[Move]:
-        """Getting a list of moves"""
-        moves_list = self.__get_required_moves_list(side)
-        if not (moves_list):
-            moves_list = self.__get_optional_moves_list(side)
-        return moves_list
-
-    def __get_required_moves_list(self, side: SideType) -> list[Move]:
-        """Getting a list of required moves"""
-        moves_list = []
-
-        # Defining checker types
-        if (side == SideType.WHITE):
-            friendly_checkers = WHITE_CHECKERS
-            enemy_checkers = BLACK_CHECKERS
-        elif (side == SideType.BLACK):
-            friendly_checkers = BLACK_CHECKERS
-            enemy_checkers = WHITE_CHECKERS
-        else:
-            return moves_list
+        return result != GameResult.IN_PROGRESS
 
-        for y in range(self.__field.y_size):
-            for x in range(self.__field.x_size):
+    def __finish_game(self, losing_side: SideType):
+        """Announcing the winner and starting a new game"""
+        self.__skip_animations()
+        self.__bot_worker.stop_pondering()
 
-                # For a regular checker
-                if (self.__field.type_at(x, y) == friendly_checkers[0]):
-                    for offset in MOVE_OFFSETS:
-                        if not (self.__field.is_within(x + offset.x * 2, y + offset.y * 2)): continue
-
-                        if self.__field.type_at(x + offset.x, y + offset.y) in enemy_checkers and self.__field.type_at(
-                                x + offset.x * 2, y + offset.y * 2) == CheckerType.NONE:
-                            moves_list.append(Move(x, y, x + offset.x * 2, y + offset.y * 2))
-
-                # For the Queen
-                elif (self.__field.type_at(x, y) == friendly_checkers[1]):
-                    for offset in MOVE_OFFSETS:
-                        if not (self.__field.is_within(x + offset.x * 2, y + offset.y * 2)): continue
-
-                        has_enemy_checker_on_way = False
-
-                        for shift in range(1, self.__field.size):
-                            if not (self.__field.is_within(x + offset.x * shift, y + offset.y * shift)): continue
-
-                            # If there was no enemy checker on the way
-                            if (not has_enemy_checker_on_way):
-                                if (self.__field.type_at(x + offset.x * shift, y + offset.y * shift) in enemy_checkers):
-                                    has_enemy_checker_on_way = True
-                                    continue
-                                # If there is an allied checker on the way, then finish the cycle
-                                elif (self.__field.type_at(x + offset.x * shift,
-                                                           y + offset.y * shift) in friendly_checkers):
-                                    break
-
-                            # If there was an enemy checker on the way
-                            if (has_enemy_checker_on_way):
-                                if (self.__field.type_at(x + offset.x * shift,
-                                                         y + offset.y * shift) == CheckerType.NONE):
-                                    moves_list.append(Move(x, y, x + offset.x * shift, y + offset.y * shift))
-                                else:
-                                    break
-
-        return moves_list
-
-    def __get_optional_moves_list(self, side: SideType) -> list[Move]:
-        """Getting a list of optional moves"""
-        moves_list = []
-
-        # Defining checker types
-        if (side == SideType.WHITE):
-            friendly_checkers = WHITE_CHECKERS
-        elif (side == SideType.BLACK):
-            friendly_checkers = BLACK_CHECKERS
+        if (losing_side == SideType.WHITE):
+            answer = messagebox.showinfo('The end of the game', 'Black wins')
+            if self.__game_type == GameType.PVE:
+                self.__leaderboard_writer.add_player(self.__player_names["white"],
+                                                     self.__field.white_score - self.__field.black_score)
+            else:
+                self.__leaderboard_writer.add_player(self.__player_names["black"], self.__field.black_score)
         else:
-            return moves_list
+            answer = messagebox.showinfo('The end of the game', 'White wins')
+            self.__leaderboard_writer.add_player(self.__player_names["white"], self.__field.white_score)
 
-        for y in range(self.__field.y_size):
-            for x in range(self.__field.x_size):
-                # For a regular checker
-                if (self.__field.type_at(x, y) == friendly_checkers[0]):
-                    for offset in MOVE_OFFSETS[:2] if side == SideType.WHITE else MOVE_OFFSETS[2:]:
-                        if not (self.__field.is_within(x + offset.x, y + offset.y)): continue
-
-                        if (self.__field.type_at(x + offset.x, y + offset.y) == CheckerType.NONE):
-                            moves_list.append(Move(x, y, x + offset.x, y + offset.y))
-
-                # For the Queen
-                elif (self.__field.type_at(x, y) == friendly_checkers[1]):
-                    for offset in MOVE_OFFSETS:
-                        if not (self.__field.is_within(x + offset.x, y + offset.y)): continue
-
-                        for shift in range(1, self.__field.size):
-                            if not (self.__field.is_within(x + offset.x * shift, y + offset.y * shift)): continue
-
-                            if (self.__field.type_at(x + offset.x * shift, y + offset.y * shift) == CheckerType.NONE):
-                                moves_list.append(Move(x, y, x + offset.x * shift, y + offset.y * shift))
-                            else:
-                                break
-        return moves_list
+        # Start new game
+        self.__init__(self.__canvas, self.__field.x_size, self.__field.y_size, self.__player_names, GameType.PVP,
+                      self.__bot_worker, self.__leaderboard_writer)
@@ -1,60 +1,118 @@
+from queue import Queue, Empty
+from threading import Thread, Event
+from time import monotonic
 import sqlite3
+import sys
 
-conn = sqlite3.connect("leaderBoard.db")
-c = conn.cursor()
+# File of the leaderboard database
+LEADERBOARD_PATH = 'leaderBoard.db'
+# Number of best results shown
+LEADERBOARD_SIZE = 10
+# Time the results are gathered for before being written in one transaction (in seconds)
+LEADERBOARD_FLUSH_INTERVAL = 1.0
 
 
-def create_table():
-    c.execute('CREATE TABLE IF NOT EXISTS leaderBoard(name TEXT, score INT)')
+class Leaderboard:
+    """Results of all the games played, the best of them make the leaderboard"""
 
+    def __init__(self, path: str = LEADERBOARD_PATH):
+        self.__connection = sqlite3.connect(path)
+        # Readers don't wait for the writer and the other way round
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.create_table()
 
-def add_player(name,score):
-    if table_full():  # checks if the table is full
-        if not lowest_score(
-                score):  # if the table full and the score is higher than at least the last score add the score to the table
-            c.execute('DELETE FROM leaderBoard WHERE rowid=10')
-            c.execute("INSERT INTO leaderBoard (name,score) VALUES (?,?)",
-                      (name, score))
-            c.execute(
-                "CREATE TABLE ordered_board(name TEXT, score INT)")  # creates a temperor table for sorting the data
-            c.execute(
-                "INSERT INTO ordered_board (name,score) SELECT name,score FROM leaderBoard ORDER BY score DESC ")
-            c.execute("DROP TABLE leaderBoard")
-            c.execute("ALTER TABLE ordered_board RENAME TO leaderBoard")
-    else:  # add the player if the table isn't full
-        c.execute("INSERT INTO leaderBoard (name,score) VALUES (?,?)",
-                  (name, score))
-        c.execute(
-            "CREATE TABLE ordered_board(name TEXT, score INT)")  # creates a temperor table for sorting the data
-        c.execute(
-            "INSERT INTO ordered_board (name,score) SELECT name,score FROM leaderBoard ORDER BY score DESC ")
-        c.execute("DROP TABLE leaderBoard")  #
-        c.execute("ALTER TABLE ordered_board RENAME TO leaderBoard")
-    conn.commit()
-    c.close()
-    conn.close()
+    def create_table(self):
+        with self.__connection:
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS leaderBoard(name TEXT, score INT)')
+            # Best results are read from the index instead of sorting the table
+            self.__connection.execute('CREATE INDEX IF NOT EXISTS leaderBoard_score ON leaderBoard(score DESC)')
 
+    def add_player(self, name: str, score: int):
+        """Recording the result of a game"""
+        with self.__connection:
+            self.__connection.execute('INSERT INTO leaderBoard (name, score) VALUES (?, ?)', (name, score))
 
-def show_table():
-    c.execute('SELECT ROWID, name, score FROM leaderBoard')
-    res = c.fetchall()
-    table = ""
-    for row in c.fetchall():
-        table += str(row[0]) + "." + str(row[1]) + ": " + str(row[2]) + " pts\n"
+    def add_players(self, results: list[tuple[str, int]]):
+        """Recording the (name, score) results of several games in one transaction"""
+        with self.__connection:
+            self.__connection.executemany('INSERT INTO leaderBoard (name, score) VALUES (?, ?)', results)
 
-    print(table)
+    def top(self, count: int = LEADERBOARD_SIZE) -> list[tuple[int, str, int]]:
+        """Getting the best results as (place, name, score)"""
+        rows = self.__connection.execute('SELECT name, score FROM leaderBoard ORDER BY score DESC, rowid LIMIT ?',
+                                         (count,))
+        return [(place, name, score) for place, (name, score) in enumerate(rows, 1)]
 
-    return res
+    @property
+    def count(self) -> int:
+        """Number of the results recorded"""
+        return self.__connection.execute('SELECT COUNT(*) FROM leaderBoard').fetchone()[0]
 
+    def close(self):
+        self.__connection.close()
 
-def table_full():
-    c.execute('SELECT * FROM leaderBoard')
-    amount = c.fetchall()
 
-    return len(amount) >= 10
+class LeaderboardWriter:
+    """Records results in the background, so that finishing a game never waits for the disk
 
+    The results are gathered for up to the flush interval after the first of
+    them and written in one transaction. `flush` waits until the results added
+    before it are written, `close` writes the rest and stops the writer.
+    """
 
-def lowest_score(score):
-    c.execute('SELECT score FROM leaderBoard WHERE score<?', (score,))
-    amount = c.fetchall()
-    return len(amount) == 0
+    def __init__(self, path: str = LEADERBOARD_PATH, flush_interval: float = LEADERBOARD_FLUSH_INTERVAL):
+        self.__path = path
+        self.__flush_interval = flush_interval
+        # Results, flush events and None to stop
+        self.__queue = Queue()
+        self.__thread = Thread(target=self.__run, name='leaderboard-writer', daemon=True)
+        self.__thread.start()
+
+    def add_player(self, name: str, score: int):
+        """Queueing the result of a game"""
+        self.__queue.put((name, score))
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waiting until the results queued so far are written, False on timeout"""
+        flushed = Event()
+        self.__queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def close(self):
+        self.__queue.put(None)
+        self.__thread.join()
+
+    def __run(self):
+        # The connection belongs to the writer's thread
+        leaderboard = Leaderboard(self.__path)
+
+        stopped = False
+        while not (stopped):
+            item = self.__queue.get()
+            deadline = monotonic() + self.__flush_interval
+            results = []
+            flushed = []
+
+            while True:
+                if (item is None):
+                    stopped = True
+                    break
+                if (isinstance(item, Event)):
+                    flushed.append(item)
+                    break
+                results.append(item)
+
+                try:
+                    item = self.__queue.get(timeout=max(0.0, deadline - monotonic()))
+                except Empty:
+                    break
+
+            if (results):
+                try:
+                    leaderboard.add_players(results)
+                except sqlite3.Error as error:
+                    print(f'Failed to record {len(results)} results: {error}', file=sys.stderr)
+            for event in flushed:
+                event.set()
+
+        leaderboard.close()
@@ -0,0 +1,170 @@
+from concurrent.futures import ProcessPoolExecutor, wait
+from threading import Timer, Event
+from random import Random
+from time import perf_counter
+import cProfile
+import multiprocessing
+import os
+
+from checkers.bitboard import BitboardField
+from checkers.move import Move
+from checkers.search import Search, SearchResult, WIN_SCORE, WIN_THRESHOLD
+from checkers.stats import SearchStats
+from checkers.tablebase import Tablebase
+from checkers.enums import SideType
+from checkers.constants import MAX_PREDICTION_DEPTH
+
+# Searches of the worker process by field size, kept between searches so that their transposition tables are reused
+_searches = {}
+# Event shared with the parent process to stop the current search
+_stop_event = None
+# Path prefix and profiler of the move being profiled, the profile adds up over the depths of the move
+_profile = None
+
+
+def _init_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+
+def search_snapshot(snapshot: tuple, side: SideType, depth: int, node_limit: int, root_turns: list[tuple[Move, ...]],
+                    measure_times: bool = False, profile_path: str = None, start_depth: int = 1,
+                    time_limit: float = 0, stop_event=None) -> SearchResult:
+    """Searching the field described by the snapshot (runs in the worker process, or in this one for a single worker)
+
+    With `profile_path` the search is profiled into '<profile_path>-<process id>.prof'.
+    """
+    global _profile
+    x_size, y_size = snapshot[:2]
+    if ((x_size, y_size) not in _searches):
+        _searches[x_size, y_size] = Search(MAX_PREDICTION_DEPTH,
+                                           tablebase=Tablebase.load(x_size=x_size, y_size=y_size))
+    search = _searches[x_size, y_size]
+
+    profiler = None
+    if (profile_path):
+        if (_profile is None or _profile[0] != profile_path):
+            _profile = (profile_path, cProfile.Profile())
+        profiler = _profile[1]
+        profiler.enable()
+
+    try:
+        return search.search(BitboardField.from_snapshot(snapshot), side, depth, time_limit, node_limit,
+                             stop_event or _stop_event, root_turns, measure_times, start_depth)
+    finally:
+        if (profiler):
+            profiler.disable()
+            # Dumped after every search, as the move may be stopped at any depth
+            profiler.dump_stats(f'{profile_path}-{os.getpid()}.prof')
+
+
+class ParallelSearch:
+    """Search splitting the first turns between worker processes
+
+    Depths are deepened one after another: every worker searches its share of
+    the first turns to just the next depth, and the best of their results is the
+    result of the depth. A depth cut short by the time limit or by `stop` is
+    dropped, so the result always comes from the last depth completed by every
+    worker. A single worker searches in this process without splitting anything.
+    """
+
+    def __init__(self, workers: int, max_depth: int = MAX_PREDICTION_DEPTH, seed: int = None):
+        self.__workers = max(1, workers)
+        self.__max_depth = max_depth
+        self.__random = Random(seed)
+
+        if (self.__workers == 1):
+            self.__stop_event = Event()
+            self.__executor = None
+            return
+
+        # Not forking the process that may run the Tk interpreter
+        context = multiprocessing.get_context('spawn')
+        self.__stop_event = context.Event()
+        self.__executor = ProcessPoolExecutor(max_workers=self.__workers, mp_context=context,
+                                              initializer=_init_worker, initargs=(self.__stop_event,))
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    def search(self, field: BitboardField, side: SideType, depth: int = 0, time_limit: float = 0,
+               node_limit: int = 0, measure_times: bool = False, profile_path: str = None) -> SearchResult:
+        """Searching for the best turn of the side within the depth, time (in seconds) and node limits
+
+        The stats of the result add up every worker and depth. With `profile_path` each worker
+        dumps its profile of the search to '<profile_path>-<process id>.prof'.
+        """
+        started = perf_counter()
+        depth = depth or self.__max_depth
+        self.__stop_event.clear()
+
+        if not (self.__executor):
+            return search_snapshot(field.snapshot(), side, depth, node_limit, None, measure_times, profile_path,
+                                   time_limit=time_limit, stop_event=self.__stop_event)
+
+        # Whole turns are split, so that the multi-captures of one checker are searched apart and compared
+        turns_list = [turn.moves for turn in field.turns(side)]
+        # Equal turns are picked at random
+        self.__random.shuffle(turns_list)
+        root_turns_lists = [turns_list[index::self.__workers] for index in range(self.__workers)]
+        root_turns_lists = [root_turns for root_turns in root_turns_lists if root_turns]
+        if not (root_turns_lists):
+            return SearchResult([], [], -WIN_SCORE, 1, 0)
+
+        timer = None
+        if (time_limit):
+            timer = Timer(time_limit, self.__stop_event.set)
+            timer.start()
+
+        result = None
+        aborted = False
+        nodes = 0
+        stats = SearchStats()
+        try:
+            for current_depth in range(1, depth + 1):
+                worker_node_limit = max(1, (node_limit - nodes) // len(root_turns_lists)) if node_limit else 0
+                futures = [self.__executor.submit(search_snapshot, field.snapshot(), side, current_depth,
+                                                  worker_node_limit, root_turns, measure_times, profile_path,
+                                                  current_depth) for root_turns in root_turns_lists]
+                wait(futures)
+                results = [future.result() for future in futures]
+                nodes += sum(result.nodes for result in results)
+                for worker_result in results:
+                    stats.add(worker_result.stats)
+
+                # The depth was cut short, a worker that ended early with a found win or loss has finished it
+                if (any(result.aborted for result in results)):
+                    aborted = True
+                    break
+
+                best_result = max(results, key=lambda result: result.score)
+                result = SearchResult(best_result.moves, best_result.principal_variation, best_result.score,
+                                      current_depth, nodes, stats)
+
+                # No choice to make or a found win
+                if (len(turns_list) <= 1 or abs(result.score) > WIN_THRESHOLD):
+                    break
+                if (current_depth < depth and (self.__stop_event.is_set() or node_limit and nodes >= node_limit)):
+                    aborted = True
+                    break
+        finally:
+            if (timer):
+                timer.cancel()
+
+        if (aborted):
+            result = SearchResult(result.moves, result.principal_variation, result.score, result.depth, nodes,
+                                  stats, True)
+
+        stats.depth = result.depth if result else 0
+        stats.time = perf_counter() - started
+        return result
+
+    def stop(self):
+        """Asking the running search to return its best move found so far"""
+        self.__stop_event.set()
+
+    def shutdown(self):
+        self.stop()
+        if (self.__executor):
+            self.__executor.shutdown(wait=False, cancel_futures=True)
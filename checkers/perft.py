@@ -0,0 +1,96 @@
+"""Move generator benchmark and correctness check (perft)
+
+Counts the positions reached after every sequence of turns up to a depth from
+the start position and from a set of tricky positions, and compares the counts
+with the known ones. A multi-capture is one turn however many jumps it takes.
+
+Run from the repository root:
+    python -m checkers.perft --depth 6
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+import sys
+
+from checkers.rules import Position
+
+# Positions in the text notation of Position with the known counts for depths 1, 2, ...
+PERFT_POSITIONS = [
+    # Start position
+    ('w .b.b.b.b/b.b.b.b./.b.b.b.b/......../......../w.w.w.w./.w.w.w.w/w.w.w.w.',
+     [7, 49, 302, 1469, 7482, 37986, 190146]),
+    # Queen long jumps over a checker and into a second capture
+    ('w ......../......b./......../......../...b.B../......../......../W.......',
+     [4, 26, 180, 1126, 9404, 67811, 522430]),
+    # Branching multi-capture chains of a regular checker
+    ('w .......B/....b.../......../..b.b.b./......../..b...../.w.....W/........',
+     [12, 37, 287, 2453, 18249, 152450, 1190325]),
+    # Promotion in the middle of a capture, the new queen goes on capturing
+    ('w ......../..b.b.b./...w..../......../.....b../......../......../........',
+     [5, 14, 96, 220, 1367, 3062, 18863]),
+    # Regular checker capturing backwards, promotion of black
+    ('b ......../......../......../....b.../......../..W.W.W./...b..../........',
+     [2, 6, 7, 103, 287, 2663, 13136]),
+    # Queens against a few regular checkers
+    ('w .B....../......../...w..../......../...b..../......../......../......W.',
+     [3, 12, 108, 924, 6928, 51749, 384241]),
+]
+
+
+def perft(position: Position, depth: int) -> int:
+    """Counting the positions after `depth` turns"""
+    if (depth == 0):
+        return 1
+
+    # Every way of making a multi-capture is a turn of its own
+    turns_list = position.legal_turns()
+    if (depth == 1):
+        return len(turns_list)
+
+    nodes = 0
+    for turn in turns_list:
+        undo = position.make_turn(turn)
+        nodes += perft(position, depth - 1)
+        position.unmake_turn(turn, undo)
+
+    return nodes
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--depth', type=int, default=5)
+    args = parser.parse_args()
+
+    total_nodes = 0
+    total_time = 0.0
+    mismatches = 0
+
+    for text, expected_nodes in PERFT_POSITIONS:
+        print(text)
+        for depth in range(1, args.depth + 1):
+            position = Position.from_string(text)
+
+            started = perf_counter()
+            nodes = perft(position, depth)
+            elapsed = perf_counter() - started
+
+            total_nodes += nodes
+            total_time += elapsed
+
+            if (depth > len(expected_nodes)):
+                status = 'unknown'
+            elif (nodes == expected_nodes[depth - 1]):
+                status = 'ok'
+            else:
+                status = f'MISMATCH, expected {expected_nodes[depth - 1]}'
+                mismatches += 1
+
+            print(f'  depth {depth}: {nodes} nodes in {elapsed:.3f} s ({nodes / max(elapsed, 1e-9):.0f} nodes/s) {status}')
+
+    print(f'total: {total_nodes} nodes in {total_time:.2f} s ({total_nodes / max(total_time, 1e-9):.0f} nodes/s)')
+    if (mismatches):
+        print(f'{mismatches} mismatches')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+from typing import NamedTuple
+
+from checkers.bitboard import BitboardField, BitboardUndo, BitboardTurn
+from checkers.move import Move
+from checkers.enums import CheckerType, SideType, GameResult
+
+# Characters of checker types in the text notation of positions
+CHECKER_CHARACTERS = {
+    CheckerType.NONE: '.',
+    CheckerType.WHITE_REGULAR: 'w',
+    CheckerType.WHITE_QUEEN: 'W',
+    CheckerType.BLACK_REGULAR: 'b',
+    CheckerType.BLACK_QUEEN: 'B'
+}
+
+
+class PositionUndo(NamedTuple):
+    """Record needed to take a move back"""
+    field_undo: BitboardUndo
+    side: SideType
+    # Cell of the checker that was in the middle of a multi-capture
+    capturing_cell: tuple[int, int]
+    # Legal moves and turns known before the move, None if they were not generated
+    legal_moves: list[Move]
+    legal_turns: list[BitboardTurn]
+    # Moves of the turn made before the move
+    turn_moves: tuple[Move, ...]
+
+
+class Position:
+    """Checkers on the field together with the side to move
+
+    A capture that can be continued by the same checker does not end the turn:
+    until the multi-capture is over, only that checker may move, and only by
+    capturing. The side that has no moves loses.
+
+    The whole turns, multi-captures played out to the end, are generated once
+    at the start of a turn; the legal moves in the middle of a multi-capture
+    are the next jumps of the turns that begin with the jumps made. Moves and
+    turns are kept until a move changes the position, taking the move back
+    brings them back too. The field should therefore only be changed through
+    the position.
+    """
+
+    def __init__(self, x_size: int, y_size: int, side: SideType = SideType.WHITE):
+        self.__field = BitboardField(x_size, y_size)
+        self.__side = side
+        self.__capturing_cell = None
+        # Legal moves and turns of the current position, None until asked for
+        self.__legal_moves = None
+        self.__legal_turns = None
+        # Moves of the current turn made so far
+        self.__turn_moves = ()
+
+    @classmethod
+    def copy(cls, position_instance: 'Position') -> 'Position':
+        """Creates a copy of the position from the sample"""
+        position_copy = cls(position_instance.field.x_size, position_instance.field.y_size, position_instance.side)
+        position_copy.__field = BitboardField.copy(position_instance.field)
+        position_copy.__capturing_cell = position_instance.capturing_cell
+        position_copy.__legal_moves = position_instance.__legal_moves
+        position_copy.__legal_turns = position_instance.__legal_turns
+        position_copy.__turn_moves = position_instance.__turn_moves
+        return position_copy
+
+    @classmethod
+    def from_field(cls, field: BitboardField, side: SideType) -> 'Position':
+        """Creates a position with a copy of the field at the start of the side's turn"""
+        position = cls(field.x_size, field.y_size, side)
+        position.__field = BitboardField.copy(field)
+        return position
+
+    @classmethod
+    def from_string(cls, text: str) -> 'Position':
+        """Creates a position from its text notation, see `to_string`"""
+        side_text, rows_text = text.split()
+        rows = rows_text.split('/')
+        types = {character: type for type, character in CHECKER_CHARACTERS.items()}
+
+        position = cls(len(rows[0]), len(rows), SideType.WHITE if side_text == 'w' else SideType.BLACK)
+        for y, row in enumerate(rows):
+            if (len(row) != len(rows[0])):
+                raise ValueError(f'Row {y} of the position has a different length')
+            for x, character in enumerate(row):
+                position.field.set_type_at(x, y, types[character])
+
+        return position
+
+    def to_string(self) -> str:
+        """Getting the text notation: the side to move ('w' or 'b') and the rows from the top, such as
+        'w .b.b.b.b/b.b.b.b./.b.b.b.b/......../......../w.w.w.w./.w.w.w.w/w.w.w.w.'"""
+        rows = (''.join(CHECKER_CHARACTERS[self.__field.type_at(x, y)] for x in range(self.__field.x_size))
+                for y in range(self.__field.y_size))
+        return ('w ' if self.__side == SideType.WHITE else 'b ') + '/'.join(rows)
+
+    @property
+    def field(self) -> BitboardField:
+        return self.__field
+
+    @property
+    def side(self) -> SideType:
+        """Side to move"""
+        return self.__side
+
+    @property
+    def capturing_cell(self) -> tuple[int, int]:
+        """Cell of the checker that has to continue its multi-capture, None between turns"""
+        return self.__capturing_cell
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Hash of the checkers placement and the side to move"""
+        zobrist_hash = self.__field.zobrist_hash
+        if (self.__side == SideType.BLACK):
+            zobrist_hash ^= self.__field.zobrist.black_to_move
+        return zobrist_hash
+
+    def legal_moves(self) -> list[Move]:
+        """Getting a list of moves of the side to move, the list is shared and must not be changed"""
+        if (self.__legal_moves is None):
+            made = len(self.__turn_moves)
+            self.__legal_moves = list(dict.fromkeys(turn.moves[made] for turn in self.legal_turns()))
+        return self.__legal_moves
+
+    def legal_turns(self) -> list[BitboardTurn]:
+        """Getting a list of the whole turns of the side to move, in the middle of a multi-capture the ones that
+        begin with the jumps made, the list is shared and must not be changed"""
+        if (self.__legal_turns is None):
+            self.__legal_turns = self.__field.turns(self.__side)
+        return self.__legal_turns
+
+    def is_legal(self, move: Move) -> bool:
+        return move in self.legal_moves()
+
+    def make_move(self, move: Move) -> PositionUndo:
+        """Making a move, returns the record to take it back with"""
+        legal_turns = self.legal_turns()
+        field_undo = self.__field.make_move(move)
+        undo = PositionUndo(field_undo, self.__side, self.__capturing_cell, self.__legal_moves, legal_turns,
+                            self.__turn_moves)
+
+        made = len(self.__turn_moves)
+        legal_turns = [turn for turn in legal_turns if turn.moves[made] == move]
+        self.__legal_moves = None
+
+        # If the turns go on with the same checker, the multi-capture is not over
+        if (legal_turns and len(legal_turns[0].moves) > made + 1):
+            self.__capturing_cell = (move.to_x, move.to_y)
+            self.__legal_turns = legal_turns
+            self.__turn_moves += (move,)
+        else:
+            self.__capturing_cell = None
+            self.__side = self.__side.opposite()
+            self.__legal_turns = None
+            self.__turn_moves = ()
+
+        return undo
+
+    def make_turn(self, turn: BitboardTurn) -> PositionUndo:
+        """Making a whole turn of the side to move at once, returns the record to take it back with"""
+        field_undo = self.__field.make_turn(turn)
+        undo = PositionUndo(field_undo, self.__side, self.__capturing_cell, self.__legal_moves, self.__legal_turns,
+                            self.__turn_moves)
+
+        self.__capturing_cell = None
+        self.__side = self.__side.opposite()
+        self.__legal_moves = self.__legal_turns = None
+        self.__turn_moves = ()
+
+        return undo
+
+    def unmake_turn(self, turn: BitboardTurn, undo: PositionUndo):
+        """Taking back the last turn made"""
+        self.__field.unmake_turn(turn, undo.field_undo)
+        self.__side = undo.side
+        self.__capturing_cell = undo.capturing_cell
+        self.__legal_moves = undo.legal_moves
+        self.__legal_turns = undo.legal_turns
+        self.__turn_moves = undo.turn_moves
+
+    def unmake_move(self, move: Move, undo: PositionUndo):
+        """Taking back the last move made"""
+        self.__field.unmake_move(move, undo.field_undo)
+        self.__side = undo.side
+        self.__capturing_cell = undo.capturing_cell
+        self.__legal_moves = undo.legal_moves
+        self.__legal_turns = undo.legal_turns
+        self.__turn_moves = undo.turn_moves
+
+    @property
+    def result(self) -> GameResult:
+        if (self.legal_moves()):
+            return GameResult.IN_PROGRESS
+        return GameResult.BLACK_WINS if self.__side == SideType.WHITE else GameResult.WHITE_WINS
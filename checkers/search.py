@@ -0,0 +1,308 @@
+from random import Random
+from math import inf
+from time import perf_counter
+
+from checkers.bitboard import BitboardField, BitboardTurn
+from checkers.move import Move
+from checkers.enums import SideType
+from checkers.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from checkers.tablebase import Tablebase
+from checkers.stats import SearchStats, TimedField
+from checkers.constants import TRANSPOSITION_TABLE_SIZE_MB
+
+# Score of a won position (the side to move has no moves left)
+WIN_SCORE = 10000
+# Scores beyond this are wins at a distance from the root
+WIN_THRESHOLD = WIN_SCORE - 1000
+# Number of nodes between checks of the time limit
+LIMITS_CHECK_INTERVAL = 256
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when its time or node budget runs out"""
+
+
+class SearchResult:
+    def __init__(self, moves: list[Move], principal_variation: list[Move], score: int, depth: int, nodes: int,
+                 stats: SearchStats = None, aborted: bool = False):
+        self.__moves = moves
+        self.__principal_variation = principal_variation
+        self.__score = score
+        self.__depth = depth
+        self.__nodes = nodes
+        self.__stats = stats or SearchStats()
+        self.__aborted = aborted
+
+    @property
+    def moves(self) -> list[Move]:
+        """Moves of the searching side's turn (more than one for a multi-capture)"""
+        return self.__moves
+
+    @property
+    def principal_variation(self) -> list[Move]:
+        return self.__principal_variation
+
+    @property
+    def score(self) -> int:
+        return self.__score
+
+    @property
+    def depth(self) -> int:
+        return self.__depth
+
+    @property
+    def nodes(self) -> int:
+        return self.__nodes
+
+    @property
+    def stats(self) -> SearchStats:
+        """Counters and timings of the whole search"""
+        return self.__stats
+
+    @property
+    def aborted(self) -> bool:
+        """Whether the limits or the stop event ended the search before its depth
+
+        A search that ends early because it has no choice to make or has found a win or a loss is not aborted.
+        """
+        return self.__aborted
+
+
+class Search:
+    """Iterative deepening negamax search with alpha-beta pruning
+
+    A ply is a whole turn: a multi-capture is made and taken back at once.
+    Pending captures at the horizon are searched out as well. Searched
+    positions are kept in a transposition table shared by consecutive searches.
+    Positions found in the endgame tablebase are scored by it without searching.
+
+    Depths are searched one after another until the time or node budget runs
+    out; the result of the last completed depth is returned, and the first
+    depth is always completed.
+    """
+
+    def __init__(self, max_depth: int, transposition_table: TranspositionTable = None, seed: int = None,
+                 tablebase: Tablebase = None):
+        self.__max_depth = max_depth
+        # Picks between equal moves, seeded for reproducible games
+        self.__random = Random(seed)
+        self.__transposition_table = transposition_table or TranspositionTable(TRANSPOSITION_TABLE_SIZE_MB)
+        self.__tablebase = tablebase
+        self.__nodes = 0
+        self.__deadline = inf
+        self.__node_limit = inf
+        self.__stop_event = None
+        self.__root_turns = None
+        self.__stats = SearchStats()
+        self.__evaluate = self.evaluate
+
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        return self.__transposition_table
+
+    def search(self, field: BitboardField, side: SideType, depth: int = 0, time_limit: float = 0,
+               node_limit: int = 0, stop_event=None, root_turns: list[tuple[Move, ...]] = None,
+               measure_times: bool = False, start_depth: int = 1) -> SearchResult:
+        """Searching for the best turn of the side within the depth, time (in seconds) and node limits
+
+        The search is also stopped early once `stop_event` (anything with `is_set()`) is set.
+        If `root_turns` (the moves of turns) are given, only those turns are considered for the first turn.
+        With `measure_times` the stats of the result get the time spent in move generation, making
+        and taking back turns and evaluation, at the cost of a slower search.
+        Deepening from a later `start_depth` is for a caller that has the result of the shallower depths:
+        the limits apply from the start, and a search stopped before its first depth has no moves.
+        """
+        started = perf_counter()
+        depth = depth or self.__max_depth
+        # Moves are made and taken back on a copy, so an aborted search leaves the field intact
+        field = BitboardField.copy(field)
+        self.__stats = stats = SearchStats()
+        self.__evaluate = self.evaluate
+        if (measure_times):
+            field = TimedField(field, stats)
+            self.__evaluate = self.__timed_evaluate
+        table_probes, table_hits = self.__transposition_table.probes, self.__transposition_table.hits
+        self.__nodes = 0
+        self.__deadline = self.__node_limit = inf
+        self.__stop_event = None
+        self.__root_turns = root_turns
+        self.__transposition_table.new_search()
+
+        result = None
+        aborted = False
+        for current_depth in range(start_depth, depth + 1):
+            # The limits only apply once there is a move to fall back on
+            if ((result or start_depth > 1) and self.__apply_limits(started, time_limit, node_limit, stop_event)):
+                aborted = True
+                break
+
+            principal_variation = []
+            try:
+                score = self.__negamax(field, side, current_depth, -inf, inf, 0, principal_variation, True)
+            except SearchAborted:
+                aborted = True
+                break
+
+            result = SearchResult(list(principal_variation[0].moves) if principal_variation else [],
+                                  [move for turn in principal_variation for move in turn.moves], score,
+                                  current_depth, self.__nodes, stats)
+
+            # No choice to make or a found win
+            if not (principal_variation) or abs(score) > WIN_THRESHOLD:
+                break
+
+        if (aborted and result):
+            result = SearchResult(result.moves, result.principal_variation, result.score, result.depth,
+                                  result.nodes, stats, True)
+        elif (aborted):
+            result = SearchResult([], [], 0, start_depth - 1, self.__nodes, stats, True)
+
+        stats.nodes = self.__nodes
+        stats.depth = result.depth if result else 0
+        stats.time = perf_counter() - started
+        stats.table_probes = self.__transposition_table.probes - table_probes
+        stats.table_hits = self.__transposition_table.hits - table_hits
+
+        return result
+
+    def __apply_limits(self, started: float, time_limit: float, node_limit: int, stop_event) -> bool:
+        """Applying the limits to the next depth, whether they are already reached"""
+        if (stop_event):
+            self.__stop_event = stop_event
+            if (stop_event.is_set()):
+                return True
+        if (time_limit):
+            self.__deadline = started + time_limit
+            # The next depth would most likely not finish in time
+            if (perf_counter() - started > time_limit / 2):
+                return True
+        if (node_limit):
+            self.__node_limit = node_limit
+            if (self.__nodes >= node_limit):
+                return True
+        return False
+
+    @staticmethod
+    def evaluate(field: BitboardField, side: SideType) -> int:
+        """Material balance from the side's point of view"""
+        if (side == SideType.WHITE):
+            return field.white_score - field.black_score
+        return field.black_score - field.white_score
+
+    def __timed_evaluate(self, field: BitboardField, side: SideType) -> int:
+        started = perf_counter()
+        score = self.evaluate(field, side)
+        self.__stats.evaluation_time += perf_counter() - started
+        return score
+
+    def __negamax(self, field: BitboardField, side: SideType, depth: int, alpha: float, beta: float, ply: int,
+                  principal_variation: list[BitboardTurn], is_root: bool = False) -> float:
+        self.__nodes += 1
+        if (self.__nodes >= self.__node_limit or not self.__nodes % LIMITS_CHECK_INTERVAL and (
+                perf_counter() >= self.__deadline or self.__stop_event and self.__stop_event.is_set())):
+            raise SearchAborted()
+
+        if (self.__tablebase and not is_root):
+            tablebase_result = self.__tablebase.probe(field, side)
+            if (tablebase_result is not None):
+                self.__stats.tablebase_hits += 1
+                return tablebase_result.outcome * (WIN_SCORE - ply - tablebase_result.distance)
+
+        key = field.zobrist_hash ^ (field.zobrist.black_to_move if side == SideType.BLACK else 0)
+        best_move = None
+        entry = self.__transposition_table.probe(key)
+        if (entry):
+            entry_depth, bound, score, best_move = entry
+            if (entry_depth >= depth and not is_root):
+                score = self.__score_from_table(score, ply)
+                if (bound == EXACT):
+                    return score
+                elif (bound == LOWER_BOUND):
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if (alpha >= beta):
+                    return score
+
+        turns_list = field.required_turns(side)
+        if not (turns_list):
+            # Quiet position at the horizon, a side that can't move has lost whatever its material
+            if (depth <= 0):
+                if not (field.has_optional_moves(side)):
+                    return -WIN_SCORE + ply
+                return self.__evaluate(field, side)
+
+            turns_list = field.optional_turns(side)
+            if not (turns_list):
+                return -WIN_SCORE + ply
+
+        if (is_root and self.__root_turns is not None):
+            turns_list = [turn for turn in turns_list if turn.moves in self.__root_turns]
+            # The score of a part of the turns is not the score of the position
+            key = None
+
+        turns_list = self.__order_turns(field, turns_list, is_root and self.__random, best_move)
+
+        original_alpha = alpha
+        best_score = -inf
+        best_turn = None
+        for turn in turns_list:
+            child_variation = []
+            undo = field.make_turn(turn)
+            score = -self.__negamax(field, side.opposite(), depth - 1, -beta, -alpha, ply + 1, child_variation)
+            field.unmake_turn(turn, undo)
+
+            if (score > best_score):
+                best_score = score
+                best_turn = turn
+                principal_variation[:] = [turn] + child_variation
+
+            alpha = max(alpha, score)
+            if (alpha >= beta):
+                break
+
+        if (key is not None):
+            if (best_score <= original_alpha):
+                bound = UPPER_BOUND
+            elif (best_score >= beta):
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+            # The first move stands for the turn, the other ways of capturing with it are tried next to it
+            self.__transposition_table.store(key, depth, bound, self.__score_to_table(best_score, ply),
+                                             best_turn.moves[0])
+
+        return best_score
+
+    @staticmethod
+    def __score_to_table(score: int, ply: int) -> int:
+        """Storing wins as the distance from the position rather than from the root"""
+        if (score > WIN_THRESHOLD):
+            return score + ply
+        elif (score < -WIN_THRESHOLD):
+            return score - ply
+        return score
+
+    @staticmethod
+    def __score_from_table(score: int, ply: int) -> int:
+        if (score > WIN_THRESHOLD):
+            return score - ply
+        elif (score < -WIN_THRESHOLD):
+            return score + ply
+        return score
+
+    @staticmethod
+    def __order_turns(field: BitboardField, turns_list: list[BitboardTurn], random: Random = None,
+                      best_move: Move = None) -> list[BitboardTurn]:
+        """Trying the turns starting with the best move from the table, then promotions and captures of queens first"""
+        turns_list = list(turns_list)
+        # Equal turns at the root are picked at random
+        if (random):
+            random.shuffle(turns_list)
+
+        queens = field.queens
+
+        def key(turn: BitboardTurn) -> int:
+            return -(4 * (turn.moves[0] == best_move) + 2 * turn.promoted + bool(turn.captured & queens))
+
+        return sorted(turns_list, key=key)
@@ -0,0 +1,50 @@
+from tkinter import PhotoImage
+from pathlib import Path
+
+from checkers.enums import CheckerType
+from checkers.constants import CELL_SIZE, CACHE_SCALED_IMAGES
+
+IMAGES_PATH = Path('images')
+# Directory of the images scaled to the cell size
+SCALED_IMAGES_PATH = IMAGES_PATH / 'scaled'
+
+SPRITE_FILES = {
+    CheckerType.WHITE_REGULAR: 'red-regular.png',
+    CheckerType.BLACK_REGULAR: 'black-regular.png',
+    CheckerType.WHITE_QUEEN: 'red-queen.png',
+    CheckerType.BLACK_QUEEN: 'black-queen.png',
+}
+
+# Checkers images by cell size, loaded once per process
+_sprites = {}
+
+
+def load_sprites(size: int = CELL_SIZE) -> dict[CheckerType, PhotoImage]:
+    """Getting the checkers images scaled to the size"""
+    if (size not in _sprites):
+        _sprites[size] = {type: _load_sprite(file_name, size) for type, file_name in SPRITE_FILES.items()}
+    return _sprites[size]
+
+
+def _load_sprite(file_name: str, size: int) -> PhotoImage:
+    source_path = IMAGES_PATH / file_name
+    scaled_path = SCALED_IMAGES_PATH / f'{source_path.stem}-{size}.png'
+
+    # Tk reads the scaled PNG itself, with no resampling
+    if (CACHE_SCALED_IMAGES and scaled_path.exists() and
+            scaled_path.stat().st_mtime >= source_path.stat().st_mtime):
+        return PhotoImage(file=scaled_path)
+
+    # PIL is only needed to scale the images that are not on disk yet
+    from PIL import Image, ImageTk
+
+    image = Image.open(source_path).resize((size, size), Image.LANCZOS)
+    if (CACHE_SCALED_IMAGES):
+        try:
+            SCALED_IMAGES_PATH.mkdir(exist_ok=True)
+            image.save(scaled_path)
+        except OSError:
+            # The images are scaled again next time
+            pass
+
+    return ImageTk.PhotoImage(image)
@@ -0,0 +1,97 @@
+from time import perf_counter
+
+from checkers.bitboard import BitboardField, BitboardTurn, BitboardUndo
+from checkers.enums import SideType
+
+
+class SearchStats:
+    """Counters and timings of one search"""
+
+    def __init__(self):
+        self.nodes = 0
+        self.depth = 0
+        # Wall time of the search (in seconds)
+        self.time = 0.0
+        self.table_probes = 0
+        self.table_hits = 0
+        self.tablebase_hits = 0
+
+        # Time spent in the parts of the search, only measured when asked for
+        self.move_generation_time = 0.0
+        self.make_unmake_time = 0.0
+        self.evaluation_time = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.time if self.time else 0.0
+
+    @property
+    def table_hit_rate(self) -> float:
+        return self.table_hits / self.table_probes if self.table_probes else 0.0
+
+    def add(self, other: 'SearchStats'):
+        """Adding up the counters and the part timings of another search (a part of the same search)"""
+        self.nodes += other.nodes
+        self.table_probes += other.table_probes
+        self.table_hits += other.table_hits
+        self.tablebase_hits += other.tablebase_hits
+        self.move_generation_time += other.move_generation_time
+        self.make_unmake_time += other.make_unmake_time
+        self.evaluation_time += other.evaluation_time
+
+    def to_dict(self) -> dict:
+        return {
+            'nodes': self.nodes,
+            'depth': self.depth,
+            'time': round(self.time, 6),
+            'nodes_per_second': round(self.nodes_per_second),
+            'table_probes': self.table_probes,
+            'table_hits': self.table_hits,
+            'tablebase_hits': self.tablebase_hits,
+            'move_generation_time': round(self.move_generation_time, 6),
+            'make_unmake_time': round(self.make_unmake_time, 6),
+            'evaluation_time': round(self.evaluation_time, 6),
+        }
+
+
+class TimedField:
+    """Field adding up the time spent in generating, making and taking back turns to the stats
+
+    Everything else is passed to the field as it is.
+    """
+
+    def __init__(self, field: BitboardField, stats: SearchStats):
+        self.__field = field
+        self.__stats = stats
+
+    def __getattr__(self, name: str):
+        return getattr(self.__field, name)
+
+    def required_turns(self, side: SideType) -> list[BitboardTurn]:
+        started = perf_counter()
+        turns_list = self.__field.required_turns(side)
+        self.__stats.move_generation_time += perf_counter() - started
+        return turns_list
+
+    def optional_turns(self, side: SideType) -> list[BitboardTurn]:
+        started = perf_counter()
+        turns_list = self.__field.optional_turns(side)
+        self.__stats.move_generation_time += perf_counter() - started
+        return turns_list
+
+    def has_optional_moves(self, side: SideType) -> bool:
+        started = perf_counter()
+        has_moves = self.__field.has_optional_moves(side)
+        self.__stats.move_generation_time += perf_counter() - started
+        return has_moves
+
+    def make_turn(self, turn: BitboardTurn) -> BitboardUndo:
+        started = perf_counter()
+        undo = self.__field.make_turn(turn)
+        self.__stats.make_unmake_time += perf_counter() - started
+        return undo
+
+    def unmake_turn(self, turn: BitboardTurn, undo: BitboardUndo):
+        started = perf_counter()
+        self.__field.unmake_turn(turn, undo)
+        self.__stats.make_unmake_time += perf_counter() - started
@@ -0,0 +1,319 @@
+"""Endgame tablebase: exact results of positions with few checkers left
+
+Every material signature (numbers of white regular checkers, white queens,
+black regular checkers and black queens) has a file with one byte per
+position and side to move: 0 for a draw, otherwise the number of turns to
+the end of the game plus one. An odd number of turns is a win of the side to
+move, an even one is a loss. Files are memory-mapped when first probed.
+
+Signatures are solved with fewer checkers and fewer regular checkers first,
+as captures and promotions only lead to those. Inside a signature the
+results are propagated back from the positions without moves, distance by
+distance (retrograde analysis over the turns generated forward).
+
+Generate from the repository root, for example:
+    python -m checkers.tablebase --pieces 3
+"""
+from argparse import ArgumentParser
+from itertools import combinations
+from math import comb
+from time import perf_counter
+from typing import NamedTuple
+import mmap
+import os
+
+from checkers.bitboard import BitboardField, BoardGeometry
+from checkers.enums import SideType
+from checkers.constants import X_SIZE, Y_SIZE
+
+# Directory of the tablebase files
+TABLEBASE_PATH = 'tablebase'
+
+TABLEBASE_MAGIC = b'CKTB'
+# Results are kept in a byte, so the longest endgame is 254 turns
+MAX_DISTANCE = 254
+
+
+class Signature(NamedTuple):
+    """Numbers of checkers of every type"""
+    white_regular: int
+    white_queen: int
+    black_regular: int
+    black_queen: int
+
+    @property
+    def pieces(self) -> int:
+        return sum(self)
+
+    @property
+    def regulars(self) -> int:
+        return self.white_regular + self.black_regular
+
+    @classmethod
+    def of(cls, white: int, black: int, queens: int) -> 'Signature':
+        return cls(bin(white & ~queens).count('1'), bin(white & queens).count('1'), bin(black & ~queens).count('1'),
+                   bin(black & queens).count('1'))
+
+    def name(self, x_size: int, y_size: int) -> str:
+        """Getting the file name, such as '8x8-1011.bin'"""
+        return f'{x_size}x{y_size}-' + ''.join(map(str, self)) + '.bin'
+
+
+class TablebaseResult(NamedTuple):
+    # 1 for a win of the side to move, -1 for a loss and 0 for a draw
+    outcome: int
+    # Number of turns to the end of the game
+    distance: int
+
+
+class TablebaseIndex:
+    """Numbering of the positions of a signature
+
+    The cells of each checker type are numbered as a combination of the
+    playable cells, and the four numbers with the side to move are combined
+    into one. Positions with checkers on the same cell or regular checkers on
+    their promotion row get numbers as well and are never probed.
+    """
+
+    def __init__(self, geometry: BoardGeometry, signature: Signature):
+        self.__signature = signature
+        # Number of a playable cell by its bit, cells are numbered in the order of bits
+        self.__cells = {bit: cell for cell, bit in enumerate(sorted(geometry.coords))}
+        self.__sizes = [comb(len(self.__cells), count) for count in signature]
+
+        self.__size = 1
+        for size in self.__sizes:
+            self.__size *= size
+
+    @property
+    def size(self) -> int:
+        """Number of positions of one side to move"""
+        return self.__size
+
+    def index(self, white: int, black: int, queens: int, side: SideType) -> int:
+        index = 1 if side == SideType.BLACK else 0
+        for bits, size in zip((white & ~queens, white & queens, black & ~queens, black & queens), self.__sizes):
+            index = index * size + self.__rank(bits)
+        return index
+
+    def __rank(self, bits: int) -> int:
+        """Number of the set of cells among the sets of the same size"""
+        rank = 0
+        count = 1
+        while (bits):
+            bit = bits & -bits
+            bits ^= bit
+            rank += comb(self.__cells[bit.bit_length() - 1], count)
+            count += 1
+        return rank
+
+
+class Tablebase:
+    """Tablebase files of a field size, opened on the first probe of each"""
+
+    def __init__(self, path: str = TABLEBASE_PATH, x_size: int = X_SIZE, y_size: int = Y_SIZE):
+        self.__path = path
+        self.__geometry = BoardGeometry.of(x_size, y_size)
+        # Mapped files and indexes by signature, None for the missing ones
+        self.__tables = {}
+
+        prefix = f'{x_size}x{y_size}-'
+        names = [name for name in os.listdir(path) if name.startswith(prefix)] if os.path.isdir(path) else []
+        self.__max_pieces = max((sum(map(int, name[len(prefix):-len('.bin')])) for name in names), default=0)
+
+    @classmethod
+    def load(cls, path: str = TABLEBASE_PATH, x_size: int = X_SIZE, y_size: int = Y_SIZE) -> 'Tablebase':
+        """Opening the tablebase if it has any files for the field size, None otherwise"""
+        tablebase = cls(path, x_size, y_size)
+        return tablebase if tablebase.max_pieces else None
+
+    @property
+    def max_pieces(self) -> int:
+        """Largest number of checkers of the positions in the tablebase"""
+        return self.__max_pieces
+
+    def probe(self, field: BitboardField, side: SideType) -> TablebaseResult:
+        """Getting the result of the position, None if the tablebase doesn't have it"""
+        if (field.white_checkers_count + field.black_checkers_count > self.__max_pieces):
+            return None
+        if (field.geometry is not self.__geometry):
+            # A field of another size
+            return None
+        if not (field.white_checkers_count and field.black_checkers_count):
+            return None
+
+        white, black, queens = field.white, field.black, field.queens
+        signature = Signature.of(white, black, queens)
+        if (signature not in self.__tables):
+            self.__tables[signature] = self.__open(signature)
+
+        table = self.__tables[signature]
+        if (table is None):
+            return None
+
+        data, index = table
+        return decode_result(data[len(TABLEBASE_MAGIC) + index.index(white, black, queens, side)])
+
+    def __open(self, signature: Signature) -> tuple:
+        path = os.path.join(self.__path, signature.name(self.__geometry.x_size, self.__geometry.y_size))
+        if not (os.path.exists(path)):
+            return None
+
+        with open(path, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if (data[:len(TABLEBASE_MAGIC)] != TABLEBASE_MAGIC):
+            raise ValueError(f'{path} is not a tablebase file')
+
+        return data, TablebaseIndex(self.__geometry, signature)
+
+
+def decode_result(value: int) -> TablebaseResult:
+    if (value == 0):
+        return TablebaseResult(0, 0)
+    distance = value - 1
+    return TablebaseResult(1 if distance % 2 else -1, distance)
+
+
+def encode_result(outcome: int, distance: int) -> int:
+    if (outcome == 0):
+        return 0
+    return distance + 1
+
+
+def signatures(pieces: int) -> list[Signature]:
+    """Getting the signatures of up to `pieces` checkers with both sides on the field, in the order of solving"""
+    result = []
+    for total in range(2, pieces + 1):
+        for white_regular in range(total + 1):
+            for white_queen in range(total - white_regular + 1):
+                for black_regular in range(total - white_regular - white_queen + 1):
+                    signature = Signature(white_regular, white_queen, black_regular,
+                                          total - white_regular - white_queen - black_regular)
+                    if (signature.white_regular + signature.white_queen and
+                            signature.black_regular + signature.black_queen):
+                        result.append(signature)
+
+    return sorted(result, key=lambda signature: (signature.pieces, signature.regulars))
+
+
+def signature_positions(geometry: BoardGeometry, signature: Signature):
+    """Generating the (white, black, queens) bits of the legal placements of the signature"""
+    cells = sorted(geometry.coords)
+    # Regular checkers never stay on their promotion row
+    white_regular_cells = [bit for bit in cells if not (1 << bit) & geometry.promotion_masks[SideType.WHITE]]
+    black_regular_cells = [bit for bit in cells if not (1 << bit) & geometry.promotion_masks[SideType.BLACK]]
+
+    def placements(cells: list[int], count: int, taken: int):
+        for chosen in combinations(cells, count):
+            bits = sum(1 << bit for bit in chosen)
+            if not (bits & taken):
+                yield bits
+
+    for white_regular in placements(white_regular_cells, signature.white_regular, 0):
+        for white_queen in placements(cells, signature.white_queen, white_regular):
+            white = white_regular | white_queen
+            for black_regular in placements(black_regular_cells, signature.black_regular, white):
+                for black_queen in placements(cells, signature.black_queen, white | black_regular):
+                    yield white, black_regular | black_queen, white_queen | black_queen
+
+
+def turn_results(field: BitboardField, side: SideType) -> set[tuple[int, int, int]]:
+    """Getting the (white, black, queens) bits after every turn of the side"""
+    results = set()
+    for turn in field.turns(side):
+        undo = field.make_turn(turn)
+        results.add((field.white, field.black, field.queens))
+        field.unmake_turn(turn, undo)
+    return results
+
+
+def solve(geometry: BoardGeometry, signature: Signature, solved: dict) -> bytearray:
+    """Getting the results of the signature's positions, the signatures its turns lead to are taken from `solved`"""
+    index = TablebaseIndex(geometry, signature)
+    results = bytearray(2 * index.size)
+
+    # Numbers of the positions leading to every position of the signature
+    predecessors = {}
+    # Numbers of turns of every position whose results are not known yet
+    remaining = {}
+    # Positions and results of their turns' positions (for the opponent) by the distance of those
+    events = [[] for _ in range(MAX_DISTANCE + 1)]
+    lost = []
+
+    for white, black, queens in signature_positions(geometry, signature):
+        field = BitboardField.from_snapshot((geometry.x_size, geometry.y_size, white, black, queens))
+        for side in (SideType.WHITE, SideType.BLACK):
+            number = index.index(white, black, queens, side)
+            turns = turn_results(field, side)
+            remaining[number] = len(turns)
+            if not (turns):
+                lost.append(number)
+
+            for result in turns:
+                result_signature = Signature.of(*result)
+                if (result_signature == signature):
+                    predecessors.setdefault(index.index(*result, side.opposite()), []).append(number)
+                elif not (result[0] and result[1]):
+                    # The opponent has no checkers left
+                    events[0].append((number, -1))
+                else:
+                    result_index, result_results = solved[result_signature]
+                    outcome, distance = decode_result(result_results[result_index.index(*result, side.opposite())])
+                    if (outcome):
+                        events[distance].append((number, outcome))
+
+    def resolve(number: int, outcome: int, distance: int):
+        if (distance > MAX_DISTANCE):
+            raise ValueError(f'{signature} has an endgame longer than {MAX_DISTANCE} turns')
+        results[number] = encode_result(outcome, distance)
+        for predecessor in predecessors.get(number, ()):
+            events[distance].append((predecessor, outcome))
+
+    for number in lost:
+        resolve(number, -1, 0)
+
+    # Results are found in the order of the distance, so the first one found for a position is the shortest.
+    # Positions reached at the longest distance are processed too, so that a longer endgame raises in `resolve`
+    for distance in range(MAX_DISTANCE + 1):
+        for number, outcome in events[distance]:
+            if (results[number]): continue
+
+            if (outcome < 0):
+                # A turn leads to a lost position of the opponent
+                resolve(number, 1, distance + 1)
+            else:
+                remaining[number] -= 1
+                # Every turn leads to a won position of the opponent
+                if (remaining[number] == 0):
+                    resolve(number, -1, distance + 1)
+
+    return results
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pieces', type=int, default=3, help='largest number of checkers on the field')
+    parser.add_argument('--output', default=TABLEBASE_PATH)
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    geometry = BoardGeometry.of(X_SIZE, Y_SIZE)
+    solved = {}
+
+    for signature in signatures(args.pieces):
+        started = perf_counter()
+        results = solve(geometry, signature, solved)
+        solved[signature] = (TablebaseIndex(geometry, signature), results)
+
+        with open(os.path.join(args.output, signature.name(X_SIZE, Y_SIZE)), 'wb') as file:
+            file.write(TABLEBASE_MAGIC)
+            file.write(results)
+
+        wins = sum(1 for value in results if value % 2 == 0 and value)
+        losses = sum(1 for value in results if value % 2)
+        print(f'{signature.name(X_SIZE, Y_SIZE)}: {wins} wins, {losses} losses, '
+              f'longest {max(results, default=1) - 1} turns, {perf_counter() - started:.1f} s')
+
+
+if __name__ == '__main__':
+    main()
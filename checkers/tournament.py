@@ -0,0 +1,143 @@
+"""Bot-versus-bot tournament between two engine configurations
+
+Run from the repository root, for example:
+    python -m checkers.tournament --games 200 --engine-a depth=6 --engine-b time=0.05,tt=4
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt, log10
+from random import Random
+from time import perf_counter
+from typing import NamedTuple
+import os
+
+from checkers.rules import Position
+from checkers.search import Search
+from checkers.transposition import TranspositionTable
+from checkers.enums import SideType, GameResult
+from checkers.constants import X_SIZE, Y_SIZE, MAX_PREDICTION_DEPTH, TRANSPOSITION_TABLE_SIZE_MB
+
+
+class EngineConfig(NamedTuple):
+    """Settings of one tournament engine"""
+    # Maximum depth, 0 for MAX_PREDICTION_DEPTH
+    depth: int = 0
+    # Seconds per move, 0 for no limit
+    time_limit: float = 0
+    # Positions per move, 0 for no limit
+    node_limit: int = 0
+    tt_size_mb: float = TRANSPOSITION_TABLE_SIZE_MB
+
+    @classmethod
+    def parse(cls, description: str) -> 'EngineConfig':
+        """Parsing settings such as 'depth=6,time=0.1,nodes=5000,tt=4'"""
+        names = {'depth': ('depth', int), 'time': ('time_limit', float), 'nodes': ('node_limit', int),
+                 'tt': ('tt_size_mb', float)}
+        settings = {}
+        for item in filter(None, description.split(',')):
+            name, _, value = item.partition('=')
+            if (name not in names):
+                raise ValueError(f'Unknown engine setting {name!r}')
+            field_name, convert = names[name]
+            settings[field_name] = convert(value)
+
+        if not (settings.get('depth') or settings.get('time_limit') or settings.get('node_limit')):
+            raise ValueError('An engine needs a depth, time or node limit')
+        return cls(**settings)
+
+
+class GameRecord(NamedTuple):
+    result: GameResult
+    # Result from the point of view of engine A: 1 win, 0.5 draw, 0 loss
+    score: float
+    turns: int
+    nodes: int
+
+
+def play_game(engine_a: EngineConfig, engine_b: EngineConfig, a_plays_white: bool, seed: int, max_turns: int,
+              opening_plies: int) -> GameRecord:
+    """Playing one game, drawn once it lasts max_turns engine turns"""
+    random = Random(seed)
+    position = Position(X_SIZE, Y_SIZE)
+
+    # Random opening turns for a variety of games, whole turns so that no multi-capture is left for the engines
+    for _ in range(opening_plies):
+        if (position.result != GameResult.IN_PROGRESS): break
+        position.make_turn(random.choice(position.legal_turns()))
+
+    engines = {}
+    for config, side in ((engine_a, SideType.WHITE if a_plays_white else SideType.BLACK),
+                         (engine_b, SideType.BLACK if a_plays_white else SideType.WHITE)):
+        engines[side] = (config, Search(config.depth or MAX_PREDICTION_DEPTH, TranspositionTable(config.tt_size_mb),
+                                        random.getrandbits(32)))
+
+    turns = nodes = 0
+    while (position.result == GameResult.IN_PROGRESS and turns < max_turns):
+        config, search = engines[position.side]
+        search_result = search.search(position.field, position.side, time_limit=config.time_limit,
+                                      node_limit=config.node_limit)
+        turns += 1
+        nodes += search_result.nodes
+
+        for move in search_result.moves:
+            position.make_move(move)
+
+    result = position.result
+    if (result == GameResult.IN_PROGRESS):
+        result = GameResult.DRAW
+
+    if (result == GameResult.DRAW):
+        score = 0.5
+    elif ((result == GameResult.WHITE_WINS) == a_plays_white):
+        score = 1.0
+    else:
+        score = 0.0
+
+    return GameRecord(result, score, turns, nodes)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--engine-a', default='depth=6', help="settings such as 'depth=6,time=0.1,nodes=5000,tt=4'")
+    parser.add_argument('--engine-b', default='depth=4')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--max-moves', type=int, default=200, help='number of turns after which a game is drawn')
+    parser.add_argument('--opening-plies', type=int, default=2, help='number of random turns to start games with')
+    args = parser.parse_args()
+
+    engine_a = EngineConfig.parse(args.engine_a)
+    engine_b = EngineConfig.parse(args.engine_b)
+
+    started = perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Engine A plays white in even games and black in odd ones
+        futures = [executor.submit(play_game, engine_a, engine_b, not game % 2, args.seed + game, args.max_moves,
+                                   args.opening_plies) for game in range(args.games)]
+        records = [future.result() for future in futures]
+    elapsed = perf_counter() - started
+
+    wins = sum(record.score == 1.0 for record in records)
+    draws = sum(record.score == 0.5 for record in records)
+    losses = len(records) - wins - draws
+
+    score = sum(record.score for record in records) / len(records)
+    deviation = sqrt(sum((record.score - score) ** 2 for record in records) / len(records))
+    # 95% confidence interval of the mean score
+    error = 1.96 * deviation / sqrt(len(records))
+
+    print(f'engine A: {engine_a}')
+    print(f'engine B: {engine_b}')
+    print(f'{len(records)} games in {elapsed:.1f} s ({len(records) / elapsed:.2f} games/s)')
+    print(f'A wins / draws / losses: {wins} / {draws} / {losses}')
+    print(f'A score: {score:.3f} +- {error:.3f}')
+    if (0 < score < 1):
+        print(f'Elo difference: {-400 * log10(1 / score - 1):+.0f}')
+    turns = sum(record.turns for record in records)
+    print(f'average nodes per move: {sum(record.nodes for record in records) / max(turns, 1):.0f}')
+    print(f'average game length: {turns / len(records):.1f} turns')
+
+
+if __name__ == '__main__':
+    main()
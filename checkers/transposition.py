@@ -0,0 +1,118 @@
+from array import array
+
+from checkers.move import Move
+
+# Kinds of stored scores
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+# Bytes taken by one entry: key, score, move, depth, bound and generation
+ENTRY_SIZE = 8 + 4 + 4 + 1 + 1 + 1
+
+
+class TranspositionTable:
+    """Fixed-size table of searched positions indexed by zobrist hash
+
+    All entries live in preallocated arrays, so the memory taken is set once by
+    the budget and does not grow however many positions are stored. A slot is
+    replaced by a search of the same or greater depth, or by any entry once the
+    slot is left over from an earlier search.
+    """
+
+    def __init__(self, size_mb: float):
+        self.__size = max(1, int(size_mb * 1024 * 1024) // ENTRY_SIZE)
+
+        self.__keys = array('Q', bytes(8 * self.__size))
+        self.__scores = array('i', bytes(4 * self.__size))
+        self.__moves = array('i', [-1]) * self.__size
+        self.__depths = array('b', bytes(self.__size))
+        self.__bounds = array('b', bytes(self.__size))
+        self.__generations = array('B', bytes(self.__size))
+
+        self.__generation = 1
+        self.reset_stats()
+
+    @property
+    def size(self) -> int:
+        """Number of entries"""
+        return self.__size
+
+    @property
+    def memory(self) -> int:
+        """Bytes taken by the entries"""
+        return sum(entries.itemsize * len(entries) for entries in (self.__keys, self.__scores, self.__moves,
+                                                                   self.__depths, self.__bounds, self.__generations))
+
+    @property
+    def probes(self) -> int:
+        return self.__probes
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def stores(self) -> int:
+        return self.__stores
+
+    @property
+    def hit_rate(self) -> float:
+        return self.__hits / self.__probes if self.__probes else 0.0
+
+    @property
+    def filled(self) -> float:
+        """Share of the slots used by the current search"""
+        return self.__generations.count(self.__generation) / self.__size
+
+    def reset_stats(self):
+        self.__probes = self.__hits = self.__stores = 0
+
+    def new_search(self):
+        """Marking the existing entries as left over from an earlier search"""
+        self.__generation = self.__generation % 255 + 1
+
+    def clear(self):
+        """Removing all entries"""
+        for entries in (self.__depths, self.__bounds, self.__generations, self.__scores):
+            entries[:] = array(entries.typecode, bytes(entries.itemsize * self.__size))
+        self.__keys[:] = array('Q', bytes(8 * self.__size))
+        self.__moves[:] = array('i', [-1]) * self.__size
+
+    def probe(self, key: int) -> tuple:
+        """Getting (depth, bound, score, move) stored for the position, None if missing"""
+        self.__probes += 1
+        index = key % self.__size
+
+        if (self.__generations[index] == 0 or self.__keys[index] != key):
+            return None
+
+        self.__hits += 1
+        return self.__depths[index], self.__bounds[index], self.__scores[index], self.__decode_move(
+            self.__moves[index])
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: Move = None):
+        """Saving the search result of the position"""
+        index = key % self.__size
+
+        if (self.__generations[index] == self.__generation and self.__keys[index] != key and
+                self.__depths[index] > depth):
+            return
+
+        self.__stores += 1
+        self.__keys[index] = key
+        self.__depths[index] = max(-128, min(depth, 127))
+        self.__bounds[index] = bound
+        self.__scores[index] = score
+        self.__moves[index] = self.__encode_move(move)
+        self.__generations[index] = self.__generation
+
+    @staticmethod
+    def __encode_move(move: Move) -> int:
+        if (move is None):
+            return -1
+        return move.from_x | move.from_y << 8 | move.to_x << 16 | move.to_y << 24
+
+    @staticmethod
+    def __decode_move(code: int) -> Move:
+        if (code < 0):
+            return None
+        return Move(code & 0xff, code >> 8 & 0xff, code >> 16 & 0xff, code >> 24 & 0xff)
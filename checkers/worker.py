@@ -0,0 +1,151 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Timer
+from random import Random
+from time import perf_counter
+import json
+import sys
+
+from checkers.bitboard import BitboardField
+from checkers.book import OpeningBook, OPENING_BOOK_PATH
+from checkers.rules import Position
+from checkers.parallel import ParallelSearch
+from checkers.search import SearchResult
+from checkers.move import Move
+from checkers.enums import SideType
+from checkers.constants import SEARCH_WORKERS, SEARCH_LOG_PATH, SEARCH_PROFILE_PATH, SEARCH_MEASURE_TIMES, \
+    PONDER_TIME_LIMIT
+
+
+class BotWorker:
+    """Runs the bot's search in worker processes in the background
+
+    The stats of every bot move are appended to the log as a JSON line if
+    there is a log path, and the search of every move is profiled into
+    '<profile_path>-<move number>-<process id>.prof' if there is a profile path.
+
+    While the player thinks, the bot may ponder: search its reply to the
+    player's move it predicts. If the player makes that move, the ponder search
+    goes on as the bot's search for what is left of the move time, otherwise
+    it is stopped and dropped. Either way the worker processes keep the
+    transposition table entries it found.
+    """
+
+    def __init__(self, workers: int = SEARCH_WORKERS, book_path: str = OPENING_BOOK_PATH,
+                 log_path: str = SEARCH_LOG_PATH, profile_path: str = SEARCH_PROFILE_PATH,
+                 measure_times: bool = SEARCH_MEASURE_TIMES):
+        self.__parallel_search = ParallelSearch(workers)
+        # Known opening turns are played from the book without searching
+        self.__book = OpeningBook.load(book_path)
+        self.__random = Random()
+        self.__log_path = log_path
+        self.__profile_path = profile_path
+        self.__measure_times = measure_times
+        # Number of the bot's moves searched or taken from the book
+        self.__move_number = 0
+        # Waits for the worker processes without blocking the caller
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+        # Snapshot of the field the bot ponders over, the side to move there, the start time and the future
+        self.__ponder = None
+
+    def search(self, field: BitboardField, side: SideType, time_limit: float, node_limit: int = 0) -> Future:
+        """Starting the search of the side's turn, the future resolves to a SearchResult"""
+        self.__move_number += 1
+        move_number = self.__move_number
+
+        if (self.__ponder):
+            snapshot, ponder_side, started, future = self.__ponder
+            self.__ponder = None
+            if (snapshot == field.snapshot() and ponder_side == side):
+                return self.__ponder_hit(future, started, time_limit, move_number, side)
+            self.__stop_ponder(future)
+
+        if (self.__book):
+            book_moves = self.__book.probe(Position.from_field(field, side), self.__random)
+            if (book_moves):
+                result = SearchResult(book_moves, book_moves, 0, 0, 0)
+                self.__log(move_number, side, result, True)
+                future = Future()
+                future.set_result(result)
+                return future
+
+        profile_path = f'{self.__profile_path}-{move_number}' if self.__profile_path else None
+        return self.__executor.submit(self.__search, BitboardField.copy(field), side, time_limit, node_limit,
+                                      move_number, profile_path)
+
+    def ponder(self, field: BitboardField, side: SideType, predicted_moves: list[Move], node_limit: int = 0):
+        """Starting to search the reply to the side's turn predicted by the moves, while the side thinks
+
+        `predicted_moves` may go on past the side's turn, such as the rest of the principal variation.
+        """
+        self.stop_pondering()
+
+        position = Position.from_field(field, side)
+        for move in predicted_moves:
+            if not (position.is_legal(move)):
+                return
+            position.make_move(move)
+            if not (position.capturing_cell):
+                break
+        else:
+            # No whole turn is predicted
+            return
+
+        ponder_field = BitboardField.copy(position.field)
+        future = self.__executor.submit(self.__parallel_search.search, ponder_field, position.side,
+                                        time_limit=PONDER_TIME_LIMIT, node_limit=node_limit,
+                                        measure_times=self.__measure_times)
+        self.__ponder = (ponder_field.snapshot(), position.side, perf_counter(), future)
+
+    def stop_pondering(self):
+        """Dropping the ponder search, if there is one"""
+        if (self.__ponder):
+            self.__stop_ponder(self.__ponder[3])
+            self.__ponder = None
+
+    def __ponder_hit(self, future: Future, started: float, time_limit: float, move_number: int,
+                     side: SideType) -> Future:
+        """Letting the ponder search run for what is left of the move time"""
+        if not (future.done()):
+            timer = Timer(max(0.0, time_limit - (perf_counter() - started)), self.__parallel_search.stop)
+            timer.start()
+            # Cancelled before the next search starts, so that it never stops that one
+            future.add_done_callback(lambda _: timer.cancel())
+
+        future.add_done_callback(lambda future: self.__log(move_number, side, future.result(), False, True))
+        return future
+
+    def __stop_ponder(self, future: Future):
+        if not (future.cancel()):
+            self.__parallel_search.stop()
+
+    def __search(self, field: BitboardField, side: SideType, time_limit: float, node_limit: int, move_number: int,
+                 profile_path: str) -> SearchResult:
+        result = self.__parallel_search.search(field, side, time_limit=time_limit, node_limit=node_limit,
+                                               measure_times=self.__measure_times, profile_path=profile_path)
+        self.__log(move_number, side, result, False)
+        return result
+
+    def __log(self, move_number: int, side: SideType, result: SearchResult, from_book: bool,
+              pondered: bool = False):
+        if not (self.__log_path):
+            return
+
+        record = {'move': move_number, 'side': side.name, 'book': from_book, 'ponder': pondered,
+                  **result.stats.to_dict()}
+        try:
+            with open(self.__log_path, 'a') as file:
+                file.write(json.dumps(record) + '\n')
+        except OSError as error:
+            # The bot plays on without its log
+            print(f'Failed to log the search stats: {error}', file=sys.stderr)
+
+    def stop(self):
+        """Asking the running search to return its best move found so far"""
+        self.__parallel_search.stop()
+
+    def shutdown(self):
+        self.stop_pondering()
+        self.__parallel_search.shutdown()
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        if (self.__book):
+            self.__book.close()
@@ -0,0 +1,28 @@
+from random import Random
+
+# Seed of the keys, fixed so that hashes match between processes and runs
+ZOBRIST_SEED = 0x5eed
+
+
+class ZobristKeys:
+    """Random 64-bit keys of every checker type on every cell of a bitboard field"""
+
+    __cache = {}
+
+    def __init__(self, cells_count: int):
+        random = Random(ZOBRIST_SEED)
+
+        self.white_regular = [random.getrandbits(64) for _ in range(cells_count)]
+        self.white_queen = [random.getrandbits(64) for _ in range(cells_count)]
+        self.black_regular = [random.getrandbits(64) for _ in range(cells_count)]
+        self.black_queen = [random.getrandbits(64) for _ in range(cells_count)]
+
+        # Mixed into the hash when black is to move
+        self.black_to_move = random.getrandbits(64)
+
+    @classmethod
+    def of(cls, cells_count: int) -> 'ZobristKeys':
+        """Getting the (shared) keys for a number of cells"""
+        if (cells_count not in cls.__cache):
+            cls.__cache[cells_count] = cls(cells_count)
+        return cls.__cache[cells_count]
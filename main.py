@@ -2,15 +2,17 @@ from tkinter import Tk, Canvas, PhotoImage, Button, Entry, ttk
 from tkinter.constants import NO, CENTER
 
 from checkers.enums import GameType
-from checkers.game import Game
-from checkers.constants import X_SIZE, Y_SIZE, CELL_SIZE
-import checkers.leaderboard as lb
+from checkers.game import Game, cell_size
+from checkers.worker import BotWorker
+from checkers.constants import X_SIZE, BOARD_SIZES
+from checkers.leaderboard import Leaderboard, LeaderboardWriter
 
 
 def main():
     # Creating a window
     main_window = Tk()
-    lb.create_table()
+    leaderboard_writer = LeaderboardWriter()
+    bot_worker = BotWorker()
     main_window.title('Checkers')
     main_window.resizable(0, 0)
     main_window.iconphoto(False, PhotoImage(file='images/icon.png'))
@@ -30,7 +32,10 @@ def main():
     my_leaderboard.heading("name", text="Name", anchor=CENTER)
     my_leaderboard.heading("score", text="Score", anchor=CENTER)
 
-    for row in lb.show_table():
+    leaderboard = Leaderboard()
+    leaderboard_rows = leaderboard.top()
+    leaderboard.close()
+    for row in leaderboard_rows:
         pl_id = row[0]
         pl_name = row[1]
         pl_score = row[2]
@@ -41,6 +46,7 @@ def main():
     def input_name(type: GameType):
         startVsBotButton.destroy()
         startVsPlayerButton.destroy()
+        sizeBox.pack()
         e.pack()
         if type == GameType.PVP:
             e1.pack()
@@ -51,33 +57,48 @@ def main():
         playerNames = dict()
         playerNames["white"] = e.get()
         opponentsName = e1.get()
+        size = int(sizeBox.get().partition('x')[0])
         e.destroy()
+        sizeBox.destroy()
         my_leaderboard.destroy()
 
         # Creating a canvas
-        main_canvas = Canvas(main_window, width=CELL_SIZE * X_SIZE, height=CELL_SIZE * Y_SIZE)
+        main_canvas = Canvas(main_window, width=cell_size(size, size) * size, height=cell_size(size, size) * size)
         main_canvas.pack()
 
         if opponentsName != "Enter opponents name":
             playerNames["black"] = e1.get()
             e1.destroy()
-            game = Game(main_canvas, X_SIZE, Y_SIZE, playerNames, GameType.PVP)
+            game = Game(main_canvas, size, size, playerNames, GameType.PVP, bot_worker, leaderboard_writer)
         else:
-            game = Game(main_canvas, X_SIZE, Y_SIZE, playerNames, GameType.PVE)
+            game = Game(main_canvas, size, size, playerNames, GameType.PVE, bot_worker, leaderboard_writer)
         main_canvas.bind("<Motion>", game.mouse_move)
         main_canvas.bind("<Button-1>", game.mouse_down)
+        # Escape makes the bot move right away
+        main_window.bind("<Escape>", lambda event: game.move_now())
+
+        resignButton = Button(main_window, text="Resign", command=game.resign)
+        resignButton.pack()
 
     e = Entry(main_window, width=40)
     e.insert(0, "Enter your name")
     e1 = Entry(main_window, width=40)
     e1.insert(0, "Enter opponents name")
     gameButton = Button(main_window, text="Start", command=start_game)
+    sizeBox = ttk.Combobox(main_window, values=[f'{size}x{size}' for size in BOARD_SIZES], state='readonly')
+    sizeBox.set(f'{X_SIZE}x{X_SIZE}')
 
     startVsBotButton = Button(main_window, text="Start vs Bot", command=lambda: input_name(GameType.PVE))
     startVsPlayerButton = Button(main_window, text="Start vs Player", command=lambda: input_name(GameType.PVP))
     startVsBotButton.pack()
     startVsPlayerButton.pack()
 
+    def close():
+        bot_worker.shutdown()
+        leaderboard_writer.close()
+        main_window.destroy()
+
+    main_window.protocol("WM_DELETE_WINDOW", close)
     main_window.mainloop()
 
 